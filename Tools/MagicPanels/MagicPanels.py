@@ -6,14 +6,208 @@ __author__ = "Darek L (github.com/dprojects)"
 # ###################################################################################################################
 
 import FreeCAD, FreeCADGui
-from PySide import QtGui
-from PySide import QtCore
+import Part, Sketcher
 
 translate = FreeCAD.Qt.translate
 
 # this should be set according to the user FreeCAD GUI settings
 gRoundPrecision = 2
 
+# object type checks cache, see isType
+gTypeCache = dict()
+
+# face direction for face plane and ( first edge < second edge ), see getFaceDetails
+gFaceDirections = {
+	( "XY", True ): "XY",
+	( "XY", False ): "YX",
+	( "XZ", False ): "XZ",
+	( "XZ", True ): "ZX",
+	( "YZ", True ): "YZ",
+	( "YZ", False ): "ZY"
+}
+
+# offset to check if the point near face is inside object, see getFaceSink
+gFaceSinkOffsets = {
+	"XY": [ 0, 0, 1 ],
+	"XZ": [ 0, 1, 0 ],
+	"YZ": [ 1, 0, 0 ]
+}
+
+# axis index of constant coordinate for face plane, see panelMove2Face
+gFacePlaneAxis = { "XY": 2, "XZ": 1, "YZ": 0 }
+
+# rotation for object created at face for face plane and face sink, see getFaceObjectRotation
+gFaceRotations = {
+	( "XY", "+" ): FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 180),
+	( "XZ", "+" ): FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90),
+	( "YZ", "+" ): FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 270),
+	( "XY", "-" ): FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 0),
+	( "XZ", "-" ): FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 270),
+	( "YZ", "-" ): FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
+}
+
+# transformation for model view rotation, see getModelRotation
+# key: signs for view direction x, y, z and view rotation pitch, roll
+# value: new X, Y, Z order made from given X, Y, Z values
+gModelRotations = {
+	# Z up X rotation
+	( -1, -1, -1, -1,  1 ): [ "-Y",  "X",  "Z" ], # X rotate 1
+	(  1, -1, -1, -1,  1 ): [ "-X", "-Y",  "Z" ], # X rotate 2
+	(  1,  1, -1, -1,  1 ): [  "Y", "-X",  "Z" ], # X rotate 3
+
+	# Z down X rotation
+	( -1, -1,  1,  1, -1 ): [  "X", "-Y", "-Z" ], # X rotate 0
+	( -1,  1,  1,  1, -1 ): [ "-Y", "-X", "-Z" ], # X rotate 1
+	(  1,  1,  1,  1, -1 ): [ "-X",  "Y", "-Z" ], # X rotate 2
+	(  1, -1,  1,  1, -1 ): [  "Y",  "X", "-Z" ], # X rotate 3
+
+	# X up Y rotation
+	( -1,  1,  1,  1,  1 ): [  "Z",  "Y", "-X" ], # Y rotate 0
+	( -1, -1,  1, -1,  1 ): [  "Z",  "X",  "Y" ], # Y rotate 1
+	( -1, -1, -1, -1, -1 ): [  "Z", "-Y",  "X" ], # Y rotate 2
+	( -1,  1, -1,  1, -1 ): [  "Z", "-X", "-Y" ], # Y rotate 3
+
+	# X down Y rotation
+	(  1,  1, -1, -1, -1 ): [ "-Z",  "Y",  "X" ], # Y rotate 0
+	(  1, -1, -1,  1, -1 ): [ "-Z",  "X", "-Y" ], # Y rotate 1
+	(  1, -1,  1,  1,  1 ): [ "-Z", "-Y", "-X" ], # Y rotate 2
+	(  1,  1,  1, -1,  1 ): [ "-Z", "-X",  "Y" ], # Y rotate 3
+
+	# Y up X rotation
+	( -1, -1, -1,  1, -1 ): [  "X",  "Z", "-Y" ], # X rotate 0
+	( -1, -1,  1,  1,  1 ): [ "-Y",  "Z", "-X" ], # X rotate 1
+	(  1, -1,  1, -1,  1 ): [ "-X",  "Z",  "Y" ], # X rotate 2
+	(  1, -1, -1, -1, -1 ): [  "Y",  "Z",  "X" ], # X rotate 3
+
+	# Y down X rotation
+	( -1,  1,  1, -1,  1 ): [  "X", "-Z",  "Y" ], # X rotate 0
+	( -1,  1, -1, -1, -1 ): [ "-Y", "-Z",  "X" ], # X rotate 1
+	(  1,  1, -1,  1, -1 ): [ "-X", "-Z", "-Y" ], # X rotate 2
+	(  1,  1,  1,  1,  1 ): [  "Y", "-Z", "-X" ], # X rotate 3
+}
+
+# sorted sizes indexes for Cube [ Length, Width, Height ] in given direction, see sizesToCubePanel
+gCubeOrder = {
+	"XY": [ 2, 1, 0 ],
+	"YX": [ 1, 2, 0 ],
+	"XZ": [ 2, 0, 1 ],
+	"ZX": [ 1, 0, 2 ],
+	"YZ": [ 0, 2, 1 ],
+	"ZY": [ 0, 1, 2 ]
+}
+
+# default panel sizes sorted, see makePanels
+gDefaultSizes = [ 18, 300, 600 ]
+
+# Pad AttachmentOffset order for given X, Y, Z position in Pad direction, see convertPosition and makePad
+gPadPositions = {
+	"XY": [ "X", "Y", "Z" ],
+	"YX": [ "X", "Y", "Z" ],
+	"XZ": [ "X", "Z", "-Y" ],
+	"ZX": [ "X", "Z", "-Y" ],
+	"YZ": [ "Y", "Z", "X" ],
+	"ZY": [ "Y", "Z", "X" ]
+}
+
+# Pad Sketch Support index at Body Origin features for given direction, see makePadFromSizes
+gPadSupports = {
+	"XY": 3,
+	"YX": 3,
+	"XZ": 4,
+	"ZX": 4,
+	"YZ": 5,
+	"ZY": 5
+}
+
+# Pad directions with long side along sketch X axis (SizeX constraint), see makePad and panelResize
+gLongSizeX = frozenset([ "XY", "XZ", "YZ" ])
+
+# move axis index and sign for given iType, see panelMove
+gMoveSteps = {
+	"Xp": [ 0, 1 ],
+	"Xm": [ 0, -1 ],
+	"Yp": [ 1, 1 ],
+	"Ym": [ 1, -1 ],
+	"Zp": [ 2, 1 ],
+	"Zm": [ 2, -1 ]
+}
+
+# side panel name and X, Z offset in panel Length for given iType, see panelSide
+gSidePanels = {
+	"1": [ "panelSideLeft", -1, 0 ],
+	"2": [ "panelSideLeftUP", 0, 1 ],
+	"3": [ "panelSideRight", 0, 0 ],
+	"4": [ "panelSideRightUP", -1, 1 ]
+}
+
+# resize step for drill bits, attribute and thickness multiplier for given iType, see panelResize
+gResizeSteps = {
+	"Part::Cylinder": {
+		"1": [ "Height", 1 ],
+		"2": [ "Height", -1 ],
+		"3": [ "Radius", 1 ],
+		"4": [ "Radius", -1 ],
+		"5": [ "Radius", 0.5 ],
+		"6": [ "Radius", -0.5 ]
+	},
+	"Part::Cone": {
+		"1": [ "Height", 1 ],
+		"2": [ "Height", -1 ],
+		"3": [ "Radius2", 0.5 ],
+		"4": [ "Radius2", -0.5 ],
+		"5": [ "Radius1", 0.5 ],
+		"6": [ "Radius1", -0.5 ]
+	}
+}
+
+# resize for panels, sorted sizes index and step sign for given iType, see panelResize
+gResizeRanks = {
+	"1": [ 2, 1 ],
+	"2": [ 2, -1 ],
+	"3": [ 1, 1 ],
+	"4": [ 1, -1 ],
+	"5": [ 0, 1 ],
+	"6": [ 0, -1 ]
+}
+
+# construction profile faces colors, see panel2profile
+gProfileColors = [
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 1.0, 0.0, 0.0),
+	(0.0, 0.0, 0.0, 0.0),
+	(0.0, 1.0, 0.0, 0.0),
+	(0.0, 1.0, 0.0, 0.0),
+	(0.0, 1.0, 0.0, 0.0)
+]
+
+# frame color, see panel2frame
+gFrameColor = (0.5098039507865906, 0.3137255012989044, 0.1568627506494522, 0.0)
+
+# default drill bit colors (middle, bottom, top), see drillHoles, drillCountersinks, drillCounterbores, edge2drillbit
+gDrillBitColors = {
+	"Hole": [ (1.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ],
+	"Countersink": [ (0.0, 1.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0) ],
+	"Counterbore": [ (0.0, 0.0, 1.0, 0.0), (0.0, 1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0) ]
+}
+
+# default joint sizes [ Length, Width, Height ], 6.35 mm (1/4 inch) multiplied by 5, 3, 1, see jointTenon and jointCustom
+gJointSizes = {
+	"Tenon": [ 31.75, 6.35, 19.05 ],
+	"Custom": [ 31.75, 19.05, 6.35 ]
+}
+
+# Pad sketch rectangle geometry and constraints, created once at first makePad call
+gPadGeometry = []
+gPadConstraints = []
+
+# Icons folder path and file names, loaded at first showInfo call
+gIconPath = ""
+gIconFiles = set()
+
 # ###################################################################################################################
 #
 #
@@ -77,13 +271,47 @@ def touchTypo(iObj):
 	return getattr(iObj, "Vertex"+"es")
 
 
+# ############################################################################
+def isType(iObj, iType):
+	'''
+	isType(iObj, iType) - the same as iObj.isDerivedFrom(iType) but the result is cached for object TypeId, 
+	so the FreeCAD type tree is checked only once for each object type.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iObj: object to check
+		iType: FreeCAD type name, e.g. "Part::Box"
+
+	Usage:
+	
+		if isType(obj, "PartDesign::Pad"):
+			do something ...
+		
+	Result:
+	
+		return True if object is derived from given type, False if not
+
+	'''
+	
+	key = ( iObj.TypeId, iType )
+	
+	if key not in gTypeCache:
+		gTypeCache[key] = iObj.isDerivedFrom(iType)
+	
+	return gTypeCache[key]
+
+
 # ############################################################################
 def normalizeBoundBox(iBoundBox):
 	'''
-	normalizeBoundBox(iBoundBox) - return normalized version of BoundBox. All values 0.01 will be rounded 
-	allowing comparison, and searches for the same face or edge.
+	normalizeBoundBox(iBoundBox) - return normalized version of BoundBox. All values will be rounded 
+	to whole mm allowing comparison, and searches for the same face or edge.
 	
 	Note: This is internal function, so there is no error pop-up or any error handling.
+	The rounding to int is wanted, the same edge at Cube and Pad may differ at the last digits, 
+	so this key matches them. To find exactly the same edge or face use getEdgeIndex or getFaceIndex.
 	
 	Args:
 	
@@ -99,27 +327,96 @@ def normalizeBoundBox(iBoundBox):
 		
 	Result:
 	
-		return normalized version for comparison if b1 == b2: you can set your own precision here
+		return normalized version for comparison if b1 == b2: 
+		The normalized BoundBox is tuple of int values (XMin, YMin, ZMin, XMax, YMax, ZMax), 
+		so it can be used as dictionary key.
 
 	'''
 
-	b = "BoundBox ("
-	b += str(int(round(iBoundBox.XMin, 0))) + ", "
-	b += str(int(round(iBoundBox.YMin, 0))) + ", "
-	b += str(int(round(iBoundBox.ZMin, 0))) + ", "
-	b += str(int(round(iBoundBox.XMax, 0))) + ", "
-	b += str(int(round(iBoundBox.YMax, 0))) + ", "
-	b += str(int(round(iBoundBox.ZMax, 0)))
-	b += ")"
+	# round without digits returns int directly
+	b = (
+		round(iBoundBox.XMin), 
+		round(iBoundBox.YMin), 
+		round(iBoundBox.ZMin), 
+		round(iBoundBox.XMax), 
+		round(iBoundBox.YMax), 
+		round(iBoundBox.ZMax)
+	)
 	
 	return b
 
 
+# ############################################################################
+def getIndexMap(iObj, iType="Edges"):
+	'''
+	getIndexMap(iObj, iType="Edges") - returns dictionary with normalized BoundBox as key and index as value 
+	for all edges or faces of given object. Create it once to search for many edges or faces of the same 
+	object shape.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iObj: object with the edges or faces
+		iType (optional): "Edges" or "Faces", by default is "Edges"
+
+	Usage:
+	
+		indexMap = getIndexMap(gObj, "Faces")
+		index = indexMap.get(normalizeBoundBox(face.BoundBox), -1)
+		
+	Result:
+	
+		return dict like { normalized BoundBox: index }, the index starts from 1 like at FreeCAD "Edge1"
+
+	'''
+
+	subs = getattr(iObj.Shape, iType)
+	
+	# reversed order to keep the first found index for the same key
+	indexMap = dict()
+	for index in range(len(subs), 0, -1):
+		indexMap[normalizeBoundBox(subs[index-1].BoundBox)] = index
+
+	return indexMap
+
+
 # ###################################################################################################################
 # Vertices
 # ###################################################################################################################
 
 
+# ###################################################################################################################
+def getVertices(iSub, iCount=0):
+	'''
+	getVertices(iSub, iCount=0) - get all vertices values for given face or edge at once.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iSub: face or edge object
+		iCount (optional): get only first iCount vertices, by default 0 means all vertices
+	
+	Usage:
+	
+		vertices = getVertices(gFace)
+		[ v1, v2 ] = getVertices(gEdge, 2)
+		
+	Result:
+	
+		Return vertices array like [ [ 1, 1, 1 ], [ 2, 2, 2 ], ... ] in the same order as at the object.
+	'''
+	
+	vertexArr = touchTypo(iSub)
+	
+	# do not read values for vertices that will not be used
+	if iCount > 0:
+		vertexArr = vertexArr[0:iCount]
+	
+	return [ [ v.X, v.Y, v.Z ] for v in vertexArr ]
+
+
 # ###################################################################################################################
 def getVertex(iFace, iEdge, iVertex):
 	'''
@@ -142,9 +439,9 @@ def getVertex(iFace, iEdge, iVertex):
 		Return vertex position.
 	'''
 	
-	vertexArr = touchTypo(iFace.Edges[iEdge])
+	v = touchTypo(iFace.Edges[iEdge])[iVertex]
 
-	return [ vertexArr[iVertex].X, vertexArr[iVertex].Y, vertexArr[iVertex].Z ]
+	return [ v.X, v.Y, v.Z ]
 
 
 # ###################################################################################################################
@@ -165,25 +462,11 @@ def getVertexAxisCross(iA, iB):
 		
 	Result:
 	
-		Return diff for vertices values.
+		Return diff for vertices values, always positive or 0 if the values are equal.
 	'''
 	
-	if iA >= 0 and iB >= 0 and iB > iA:
-		return iB - iA
-	if iB >= 0 and iA >= 0 and iA > iB:
-		return iA - iB
-		
-	if iA < 0 and iB >= 0 and iB > iA:
-		return abs(iA) + iB
-	if iB < 0 and iA >= 0 and iA > iB:
-		return abs(iB) + iA
-
-	if iA < 0 and iB <= 0 and iB > iA:
-		return abs(iA) - abs(iB)
-	if iB < 0 and iA <= 0 and iA > iB:
-		return abs(iB) - abs(iA)
-
-	return 0
+	# the distance between values is the same for all signs combinations
+	return abs(iB - iA)
 
 
 # ###################################################################################################################
@@ -211,12 +494,7 @@ def getEdgeVertices(iEdge):
 		Return vertices array like [ [ 1, 1, 1 ], [ 1, 1, 1 ] ].
 	'''
 	
-	vertexArr = touchTypo(iEdge)
-
-	v1 = [ vertexArr[0].X, vertexArr[0].Y, vertexArr[0].Z ]
-	v2 = [ vertexArr[1].X, vertexArr[1].Y, vertexArr[1].Z ]
-
-	return [ v1, v2 ]
+	return getVertices(iEdge, 2)
 
 
 # ###################################################################################################################
@@ -288,9 +566,11 @@ def getEdgeIndex(iObj, iEdge):
 
 	'''
 
+	key = str(iEdge.BoundBox)
+	
 	index = 1
 	for e in iObj.Shape.Edges:
-		if str(e.BoundBox) == str(iEdge.BoundBox):
+		if str(e.BoundBox) == key:
 			return index
 
 		index = index + 1
@@ -320,10 +600,11 @@ def getEdgeIndexByKey(iObj, iBoundBox):
 
 	'''
 
+	key = normalizeBoundBox(iBoundBox)
+	
 	index = 1
 	for e in iObj.Shape.Edges:
-		
-		if normalizeBoundBox(e.BoundBox) == normalizeBoundBox(iBoundBox):
+		if normalizeBoundBox(e.BoundBox) == key:
 			return index
 
 		index = index + 1
@@ -358,9 +639,11 @@ def getFaceIndex(iObj, iFace):
 
 	'''
 
+	key = str(iFace.BoundBox)
+	
 	index = 1
 	for f in iObj.Shape.Faces:
-		if str(f.BoundBox) == str(iFace.BoundBox):
+		if str(f.BoundBox) == key:
 			return index
 
 		index = index + 1
@@ -390,19 +673,11 @@ def getFaceIndexByKey(iObj, iBoundBox):
 
 	'''
 
+	key = normalizeBoundBox(iBoundBox)
+	
 	index = 1
-	for e in iObj.Shape.Faces:
-		
-		c = "BoundBox ("
-		c += str(int(round(e.BoundBox.XMin, 0))) + ", "
-		c += str(int(round(e.BoundBox.YMin, 0))) + ", "
-		c += str(int(round(e.BoundBox.ZMin, 0))) + ", "
-		c += str(int(round(e.BoundBox.XMax, 0))) + ", "
-		c += str(int(round(e.BoundBox.YMax, 0))) + ", "
-		c += str(int(round(e.BoundBox.ZMax, 0)))
-		c += ")"
-		
-		if c == str(iBoundBox):
+	for f in iObj.Shape.Faces:
+		if normalizeBoundBox(f.BoundBox) == key:
 			return index
 
 		index = index + 1
@@ -430,14 +705,7 @@ def getFaceVertices(iFace):
 		Return vertices array like [ [ 1, 1, 1 ], [ 2, 2, 2 ], [ 3, 3, 3 ], [ 4, 4, 4 ] ]
 	'''
 	
-	vertexArr = touchTypo(iFace)
-
-	v1 = [ vertexArr[0].X, vertexArr[0].Y, vertexArr[0].Z ]
-	v2 = [ vertexArr[1].X, vertexArr[1].Y, vertexArr[1].Z ]
-	v3 = [ vertexArr[2].X, vertexArr[2].Y, vertexArr[2].Z ]
-	v4 = [ vertexArr[3].X, vertexArr[3].Y, vertexArr[3].Z ]
-	
-	return [ v1, v2, v3, v4 ]
+	return getVertices(iFace, 4)
 
 
 # ###################################################################################################################
@@ -462,9 +730,7 @@ def getFaceType(iObj, iFace):
 
 	'''
 	
-	sizes = []
-	sizes = getSizes(iObj)
-	sizes.sort()
+	sizes = getSortedSizes(iObj)
 	
 	t = int(sizes[0])
 	
@@ -503,13 +769,11 @@ def getFaceEdges(iObj, iFace):
 
 	'''
 	
-	sizes = []
-	sizes = getSizes(iObj)
-	sizes.sort()
+	sizes = getSortedSizes(iObj)
 	
+	# all other lines are long edges, so the long size is not needed
 	t = int(sizes[0])
 	s = int(sizes[1])
-	l = int(sizes[2])
 	
 	arrAll = [ ]
 	arrThick = []
@@ -522,17 +786,18 @@ def getFaceEdges(iObj, iFace):
 			continue
 		
 		arrAll.append(e)
+		length = int(e.Length)
 		
-		if int(e.Length) == t:
+		if length == t:
 			arrThick.append(e)
 			
-		if int(e.Length) != t and int(e.Length) <= s:
+		elif length <= s:
 			arrShort.append(e)
 			
-		if int(e.Length) != t and int(e.Length) > s:
+		else:
 			arrLong.append(e)
 	
-	if len(arrThick) == len(arrAll) / 2:
+	if 2 * len(arrThick) == len(arrAll):
 		faceType = "edge"
 	else:
 		faceType = "surface"
@@ -562,26 +827,27 @@ def getFacePlane(iFace):
 	'''
 
 	[ v1, v2, v3, v4 ] = getFaceVertices(iFace)
+	[ aX, aY, aZ ] = zip(v1, v2, v3, v4)
 
 	# if Z axis not change
-	if equal(v1[2] + v2[2] + v3[2] + v4[2], 4 * v1[2]):
+	if equal(min(aZ), max(aZ)):
 		return "XY"
 	
 	# if Y axis not change
-	if equal(v1[1] + v2[1] + v3[1] + v4[1], 4 * v1[1]):
+	if equal(min(aY), max(aY)):
 		return "XZ"
 	
 	# if X axis not change
-	if equal(v1[0] + v2[0] + v3[0] + v4[0], 4 * v1[0]):
+	if equal(min(aX), max(aX)):
 		return "YZ"
 
 	return ""
 
 
 # ###################################################################################################################
-def getFaceSink(iObj, iFace):
+def getFaceSink(iObj, iFace, iPlane=""):
 	'''
-	getFaceSink(iObj, iFace) - get face sink axis direction in notation "+", or "-".
+	getFaceSink(iObj, iFace, iPlane="") - get face sink axis direction in notation "+", or "-".
 
 	Note: This is internal function, so there is no error pop-up or any error handling.
 	
@@ -589,10 +855,12 @@ def getFaceSink(iObj, iFace):
 	
 		iObj: object with the face
 		iFace: face object
+		iPlane (optional): face plane if already known, to not calculate it again
 	
 	Usage:
 	
 		sink = getFaceSink(obj, face)
+		sink = getFaceSink(obj, face, "XY")
 		
 	Result:
 	
@@ -601,19 +869,18 @@ def getFaceSink(iObj, iFace):
 		
 	'''
 
-	plane = getFacePlane(iFace)
+	if iPlane == "":
+		plane = getFacePlane(iFace)
+	else:
+		plane = iPlane
+
 	[ x, y, z ] = iFace.CenterOfMass
+	[ dx, dy, dz ] = gFaceSinkOffsets[plane]
+	[ x, y, z ] = [ x + dx, y + dy, z + dz ]
 	
-	if plane == "XY":
-		v = FreeCAD.Vector(x, y, z + 1)
-		
-	if plane == "XZ":
-		v = FreeCAD.Vector(x, y + 1, z)
-		
-	if plane == "YZ":
-		v = FreeCAD.Vector(x + 1, y, z)
-		
-	inside = iObj.Shape.BoundBox.isInside(v)
+	# the same as BoundBox.isInside but without creating Vector
+	b = iObj.Shape.BoundBox
+	inside = b.XMin <= x <= b.XMax and b.YMin <= y <= b.YMax and b.ZMin <= z <= b.ZMax
 	
 	if inside == True:
 		return "+"
@@ -640,36 +907,15 @@ def getFaceObjectRotation(iObj, iFace):
 		
 	Result:
 	
-		FreeCAD.Rotation object that can be directly pass to the setPlacement or object.Placement
+		FreeCAD.Rotation object that can be directly pass to the setPlacement or object.Placement. 
 		
 	'''
 
 	plane = getFacePlane(iFace)
-	sink = getFaceSink(iObj, iFace)
-	
-	if sink == "+":
-				
-		if plane == "XY":
-			r = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 180)
-			
-		if plane == "XZ":
-			r = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
-
-		if plane == "YZ":
-			r = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 270)
-
-	else:
-	
-		if plane == "XY":
-			r = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 0)
-			
-		if plane == "XZ":
-			r = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 270)
-
-		if plane == "YZ":
-			r = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
+	sink = getFaceSink(iObj, iFace, plane)
 	
-	return r
+	# return copy, so the caller can change it without changing the gFaceRotations
+	return FreeCAD.Rotation(gFaceRotations[( plane, sink )])
 
 
 # ###################################################################################################################
@@ -700,69 +946,40 @@ def getFaceDetails(iObj, iFace):
 	'''
 
 	[ v1, v2, v3, v4 ] = getFaceVertices(iFace)
+	[ sX, sY, sZ ] = [ sum(axis) for axis in zip(v1, v2, v3, v4) ]
 
 	direction = ""
 	
-	if int(v1[2] + v2[2] + v3[2] + v4[2]) == int(4 * v1[2]):
+	if int(sZ) == int(4 * v1[2]):
 		direction = "XY"
 	
-	if int(v1[1] + v2[1] + v3[1] + v4[1]) == int(4 * v1[1]):
+	if int(sY) == int(4 * v1[1]):
 		direction = "XZ"
 	
-	if int(v1[0] + v2[0] + v3[0] + v4[0]) == int(4 * v1[0]):
+	if int(sX) == int(4 * v1[0]):
 		direction = "YZ"
 
-	s = getSizes(iObj)
-	s.sort()
+	s = getSortedSizes(iObj)
 	thick = int(s[0])
 	
-	e1 = int(iFace.Edges[0].Length)
-	e2 = int(iFace.Edges[1].Length)
-	e3 = int(iFace.Edges[2].Length)
-	e4 = int(iFace.Edges[3].Length)
+	lengths = [ e.Length for e in iFace.Edges[0:4] ]
+	[ e1, e2, e3, e4 ] = [ int(l) for l in lengths ]
 	
-	ed = int(iFace.Edges[0].Length + iFace.Edges[1].Length + iFace.Edges[2].Length + iFace.Edges[3].Length)
+	ed = int(sum(lengths))
 	
 	if ed == int(4 * e1):
 		return [ direction, "equal" ]
 	
-	if iObj.isDerivedFrom("Part::Box"):
+	if isType(iObj, "Part::Box"):
 		
-		if direction == "XY" and e1 < e2:
-			if e1 == thick or e2 == thick:
-				return [ "XY", "edge" ]
-			else:
-				return [ "XY", "surface" ]
-
-		if direction == "XY" and e1 > e2:
-			if e1 == thick or e2 == thick:
-				return [ "YX", "edge" ]
-			else:
-				return [ "YX", "surface" ]
-
-		if direction == "XZ" and e1 > e2:
-			if e1 == thick or e2 == thick:
-				return [ "XZ", "edge" ]
-			else:
-				return [ "XZ", "surface" ]
-
-		if direction == "XZ" and e1 < e2:
-			if e1 == thick or e2 == thick:
-				return [ "ZX", "edge" ]
-			else:
-				return [ "ZX", "surface" ]
-
-		if direction == "YZ" and e1 < e2:
-			if e1 == thick or e2 == thick:
-				return [ "YZ", "edge" ]
-			else:
-				return [ "YZ", "surface" ]
-
-		if direction == "YZ" and e1 > e2:
+		# face direction depends on face plane and which edge is shorter
+		key = ( direction, e1 < e2 )
+		
+		if e1 != e2 and key in gFaceDirections:
 			if e1 == thick or e2 == thick:
-				return [ "ZY", "edge" ]
+				return [ gFaceDirections[key], "edge" ]
 			else:
-				return [ "ZY", "surface" ]
+				return [ gFaceDirections[key], "surface" ]
 
 	else:
 		
@@ -806,40 +1023,34 @@ def getReference(iObj="none"):
 
 	# object types 
 	
-	if obj.isDerivedFrom("Part::Box") or obj.isDerivedFrom("PartDesign::Pad"):
+	if isType(obj, "Part::Box") or isType(obj, "PartDesign::Pad"):
 		return obj
 
 	if ( 
-		obj.isDerivedFrom("PartDesign::Thickness") or 
-		obj.isDerivedFrom("PartDesign::Chamfer")
+		isType(obj, "PartDesign::Thickness") or 
+		isType(obj, "PartDesign::Chamfer")
 		):
 		return obj.Base[0]
 		
 	if (
-		obj.isDerivedFrom("Part::Cut") or 
-		obj.isDerivedFrom("PartDesign::Hole")
+		isType(obj, "Part::Cut") or 
+		isType(obj, "PartDesign::Hole")
 		):
 		
-		i = 0
+		# search depth level
 		base = obj
-		while True:
+		for i in range(0, 200):
 			
-			if base.isDerivedFrom("Part::Box") or base.isDerivedFrom("PartDesign::Pad"):
+			if isType(base, "Part::Box") or isType(base, "PartDesign::Pad"):
 				return base
 			
+			# the chain may mix Cut and PartDesign features, so check each base object
+			if isType(base, "Part::Cut"):
+				base = base.Base
+			elif isType(base, "PartDesign::Feature"):
+				base = base.BaseFeature
 			else:
-			
-				if obj.isDerivedFrom("Part::Cut"):
-					base = base.Base
-					
-				if obj.isDerivedFrom("PartDesign::Hole"):
-					base = base.BaseFeature
-			
-			# search depth level
-			if i > 200:
 				break
-			else:
-				i = i + 1
 		
 	if obj != "":
 		return obj
@@ -847,6 +1058,64 @@ def getReference(iObj="none"):
 	return -1
 
 
+# ###################################################################################################################
+def getSelectedSubObject(iSelEx, iIndex=0):
+	'''
+	getSelectedSubObject(iSelEx, iIndex=0) - get single selected sub-object, e.g. face, without creating 
+	all other sub-objects selected at the same object.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iSelEx: selection object from FreeCADGui.Selection.getSelectionEx()
+		iIndex (optional): index of the selected sub-object, by default the first one
+	
+	Usage:
+	
+		face = getSelectedSubObject(FreeCADGui.Selection.getSelectionEx()[0])
+		
+	Result:
+	
+		The same as iSelEx.SubObjects[iIndex].
+
+	'''
+
+	return iSelEx.Object.getSubObject(iSelEx.SubElementNames[iIndex])
+
+
+# ###################################################################################################################
+def getSelectedFacePosition():
+	'''
+	getSelectedFacePosition() - get position and rotation for new object created at the selected face, 
+	at the face 0 vertex and up from the face.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		no args
+	
+	Usage:
+	
+		[ base, x, y, z, r ] = getSelectedFacePosition()
+		
+	Result:
+	
+		Return array with reference to the base object, the face 0 vertex position and the face object rotation.
+
+	'''
+
+	selEx = FreeCADGui.Selection.getSelectionEx()[0]
+	base = getReference(selEx.Object)
+	face = getSelectedSubObject(selEx)
+	
+	[ x, y, z ] = getVertices(face, 1)[0]
+	r = getFaceObjectRotation(base, face)
+	
+	return [ base, x, y, z, r ]
+
+
 # ###################################################################################################################
 def getPlacement(iObj):
 	'''
@@ -873,10 +1142,10 @@ def getPlacement(iObj):
 
 	'''
 
-	if iObj.isDerivedFrom("PartDesign::Pad"):
+	if isType(iObj, "PartDesign::Pad"):
 		ref = iObj.Profile[0].AttachmentOffset
 		
-	elif iObj.isDerivedFrom("Sketcher::SketchObject"):
+	elif isType(iObj, "Sketcher::SketchObject"):
 		ref = iObj.AttachmentOffset
 	else:
 		ref = iObj.Placement
@@ -914,18 +1183,47 @@ def setPlacement(iObj, iX, iY, iZ, iR):
 
 	'''
 
-	if iObj.isDerivedFrom("PartDesign::Pad"):
-		iObj.Profile[0].AttachmentOffset.Base = FreeCAD.Vector(iX, iY, iZ)
-		iObj.Profile[0].AttachmentOffset.Rotation = iR
+	# set whole Placement at once, so the object is changed only once
+	placement = FreeCAD.Placement(FreeCAD.Vector(iX, iY, iZ), iR)
+
+	# Sketch uses Placement the same way as other objects
+	if isType(iObj, "PartDesign::Pad"):
+		iObj.Profile[0].AttachmentOffset = placement
 		
-	elif iObj.isDerivedFrom("Sketcher::SketchObject"):
-		iObj.Placement.Base = FreeCAD.Vector(iX, iY, iZ)
-		iObj.Placement.Rotation = iR
+	else:
+		iObj.Placement = placement
+	
+
+# ###################################################################################################################
+def setNewPlacement(iObj, iX, iY, iZ, iR):
+	'''
+	setNewPlacement(iObj, iX, iY, iZ, iR) - set placement with rotation for just created object. 
+	The new object has no rotation, so the position is set alone if the rotation is zero.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iObj: just created object, not Pad
+		iX: X Axis object position
+		iY: Y Axis object position
+		iZ: Z Axis object position
+		iR: Rotation object
+	
+	Usage:
+	
+		setNewPlacement(drillbit, 100, 100, 200, r)
 		
+	Result:
+	
+		Object drillbit should be moved into 100, 100, 200 position with rotation r.
+	'''
+
+	if iR.Angle != 0:
+		iObj.Placement = FreeCAD.Placement(FreeCAD.Vector(iX, iY, iZ), iR)
 	else:
 		iObj.Placement.Base = FreeCAD.Vector(iX, iY, iZ)
-		iObj.Placement.Rotation = iR
-	
+
 
 # ###################################################################################################################
 def resetPlacement(iObj):
@@ -948,20 +1246,15 @@ def resetPlacement(iObj):
 
 	'''
 
-	zero = FreeCAD.Vector(0, 0, 0)
-	r = FreeCAD.Rotation(FreeCAD.Vector(0.00, 0.00, 1.00), 0.00)
+	# default Placement is zero position without rotation
+	placement = FreeCAD.Placement()
 	
-	if iObj.isDerivedFrom("PartDesign::Pad"):
-		iObj.Profile[0].AttachmentOffset.Base = zero
-		iObj.Profile[0].AttachmentOffset.Rotation = r
-		
-	elif iObj.isDerivedFrom("Sketcher::SketchObject"):
-		iObj.Placement.Base = zero
-		iObj.Placement.Rotation = r
+	# Sketch uses Placement the same way as other objects
+	if isType(iObj, "PartDesign::Pad"):
+		iObj.Profile[0].AttachmentOffset = placement
 		
 	else:
-		iObj.Placement.Base = zero
-		iObj.Placement.Rotation = r
+		iObj.Placement = placement
 
 
 # ###################################################################################################################
@@ -987,8 +1280,9 @@ def getModelRotation(iX, iY, iZ):
 
 	'''
 
-	[ x, y, z ] = FreeCADGui.ActiveDocument.ActiveView.getViewDirection()
-	[ px, py, pz ] = FreeCADGui.ActiveDocument.ActiveView.viewPosition().Rotation.getYawPitchRoll()
+	view = FreeCADGui.ActiveDocument.ActiveView
+	[ x, y, z ] = view.getViewDirection()
+	[ px, py, pz ] = view.viewPosition().Rotation.getYawPitchRoll()
 	
 	# init 0 key
 	X = iX
@@ -1008,173 +1302,53 @@ def getModelRotation(iX, iY, iZ):
 		Z = -iZ
 
 	# did I say rotation? ;-) they see me rolling ;-)
-
-	# ##################################################
-	# Z up, X rotation
-	# ##################################################
-
-	# Z up, X rotate 0
-	# is base state
-
-	# Z up, X rotate 1
-	if x < 0 and y < 0 and z < 0 and py < 0 and pz > 0:
-		X = -iY
-		Y = iX
-		Z = iZ
+	# Z up, X rotate 0 is base state, see gModelRotations for all other states
+	key = tuple( (v > 0) - (v < 0) for v in [ x, y, z, py, pz ] )
+	
+	if key in gModelRotations:
 		
-	# Z up, X rotate 2
-	if x > 0 and y < 0 and z < 0 and py < 0 and pz > 0:
-		X = -iX
-		Y = -iY
-		Z = iZ
-
-	# Z up, X rotate 3
-	if x > 0 and y > 0 and z < 0 and py < 0 and pz > 0:
-		X = iY
-		Y = -iX
-		Z = iZ
-
-	# ##################################################
-	# Z down, X rotation
-	# ##################################################
-
-	# Z down, X rotate 0
-	if x < 0 and y < 0 and z > 0 and py > 0 and pz < 0:
-		X = iX
-		Y = -iY
-		Z = -iZ
+		values = { "X": iX, "-X": -iX, "Y": iY, "-Y": -iY, "Z": iZ, "-Z": -iZ }
+		[ X, Y, Z ] = [ values[v] for v in gModelRotations[key] ]
 
-	# Z down, X rotate 1
-	if x < 0 and y > 0 and z > 0 and py > 0 and pz < 0:
-		X = -iY
-		Y = -iX
-		Z = -iZ
-
-	# Z down, X rotate 2
-	if x > 0 and y > 0 and z > 0 and py > 0 and pz < 0:
-		X = -iX
-		Y = iY
-		Z = -iZ
+	return [ X, Y, Z ]
 
-	# Z down, X rotate 3
-	if x > 0 and y < 0 and z > 0 and py > 0 and pz < 0:
-		X = iY
-		Y = iX
-		Z = -iZ
 
-	# ##################################################
-	# X up, Y rotation
-	# ##################################################
-
-	# X up, Y rotate 0
-	if x < 0 and y > 0 and z > 0 and py > 0 and pz > 0:
-		X = iZ
-		Y = iY
-		Z = -iX
-	
-	# X up, Y rotate 1
-	if x < 0 and y < 0 and z > 0 and py < 0 and pz > 0:
-		X = iZ
-		Y = iX
-		Z = iY
-		
-	# X up, Y rotate 2
-	if x < 0 and y < 0 and z < 0 and py < 0 and pz < 0:
-		X = iZ
-		Y = -iY
-		Z = iX
-
-	# X up, Y rotate 3
-	if x < 0 and y > 0 and z < 0 and py > 0 and pz < 0:
-		X = iZ
-		Y = -iX
-		Z = -iY
-
-	# ##################################################
-	# X down, Y rotation
-	# ##################################################
-
-	# X down, Y rotate 0
-	if x > 0 and y > 0 and z < 0 and py < 0 and pz < 0:
-		X = -iZ
-		Y = iY
-		Z = iX
-	
-	# X down, Y rotate 1
-	if x > 0 and y < 0 and z < 0 and py > 0 and pz < 0:
-		X = -iZ
-		Y = iX
-		Z = -iY
-	
-	# X down, Y rotate 2
-	if x > 0 and y < 0 and z > 0 and py > 0 and pz > 0:
-		X = -iZ
-		Y = -iY
-		Z = -iX
-	
-	# X down, Y rotate 3
-	if x > 0 and y > 0 and z > 0 and py < 0 and pz > 0:
-		X = -iZ
-		Y = -iX
-		Z = iY
-
-	# ##################################################
-	# Y up, X rotation
-	# ##################################################
-
-	# Y up, X rotate 0
-	if x < 0 and y < 0 and z < 0 and py > 0 and pz < 0:
-		X = iX
-		Y = iZ
-		Z = -iY
-	
-	# Y up, X rotate 1
-	if x < 0 and y < 0 and z > 0 and py > 0 and pz > 0:
-		X = -iY
-		Y = iZ
-		Z = -iX
-
-	# Y up, X rotate 2
-	if x > 0 and y < 0 and z > 0 and py < 0 and pz > 0:
-		X = -iX
-		Y = iZ
-		Z = iY
-	
-	# Y up, X rotate 3
-	if x > 0 and y < 0 and z < 0 and py < 0 and pz < 0:
-		X = iY
-		Y = iZ
-		Z = iX
-	
-	# ##################################################
-	# Y down, X rotation
-	# ##################################################
-
-	# Y down, X rotate 0
-	if x < 0 and y > 0 and z > 0 and py < 0 and pz > 0:
-		X = iX
-		Y = -iZ
-		Z = iY
-
-	# Y down, X rotate 1
-	if x < 0 and y > 0 and z < 0 and py < 0 and pz < 0:
-		X = -iY
-		Y = -iZ
-		Z = iX
-	
-	# Y down, X rotate 2
-	if x > 0 and y > 0 and z < 0 and py > 0 and pz < 0:
-		X = -iX
-		Y = -iZ
-		Z = -iY
+# ###################################################################################################################
+def getPadSizes(iObj):
+	'''
+	getPadSizes(iObj) - allow to read Pad Sketch sizes from SizeX and SizeY constraints.
 	
-	# Y down, X rotate 3
-	if x > 0 and y > 0 and z > 0 and py > 0 and pz > 0:
-		X = iY
-		Y = -iZ
-		Z = -iX
+	Note: This is internal function, so there is no error pop-up or any error handling.
 	
-	return [ X, Y, Z ]
+	Args:
+	
+		iObj: Pad object
+	
+	Usage:
+	
+		[ sizeX, sizeY ] = getPadSizes(pad)
+		
+	Result:
+	
+		Returns [ SizeX, SizeY ] constraints values.
+	'''
+
+	sketch = iObj.Profile[0]
+	
+	found = 0
+	for c in sketch.Constraints:
+		if c.Name == "SizeX":
+			sizeX = c.Value
+			found += 1
+		elif c.Name == "SizeY":
+			sizeY = c.Value
+			found += 1
+		
+		# constraint names are unique at sketch
+		if found == 2:
+			break
+
+	return [ sizeX, sizeY ]
 
 
 # ###################################################################################################################
@@ -1198,26 +1372,21 @@ def getSizes(iObj):
 	'''
 
 	# for Cube panels
-	if iObj.isDerivedFrom("Part::Box"):
+	if isType(iObj, "Part::Box"):
 
 		return [ iObj.Length.Value, iObj.Width.Value, iObj.Height.Value ]
 
 	# for Pad panels
-	if iObj.isDerivedFrom("PartDesign::Pad"):
+	if isType(iObj, "PartDesign::Pad"):
 
-		for c in iObj.Profile[0].Constraints:
-			if c.Name == "SizeX":
-				sizeX = c.Value
-			if c.Name == "SizeY":
-				sizeY = c.Value
-				
+		[ sizeX, sizeY ] = getPadSizes(iObj)
 		return [ sizeX, sizeY, iObj.Length.Value ]
 
 	# to move drill bits more precisely
-	if iObj.isDerivedFrom("Part::Cylinder"):
+	if isType(iObj, "Part::Cylinder"):
 		return [ 1, 1, 1 ]
 
-	if iObj.isDerivedFrom("Part::Cone"):
+	if isType(iObj, "Part::Cone"):
 		return [ 1, 1, 1 ]
 	
 	# for custom objects
@@ -1231,6 +1400,32 @@ def getSizes(iObj):
 		return [ 100, 100, 100 ]
 
 
+# ###################################################################################################################
+def getSortedSizes(iObj):
+	'''
+	getSortedSizes(iObj) - allow to get sorted sizes for object (iObj), the thickness will be first.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iObj: object to get sizes
+	
+	Usage:
+	
+		[ thick, short, long ] = getSortedSizes(obj)
+		
+	Result:
+		
+		Returns sorted sizes array, e.g. [ 18, 300, 600 ] for default panel.
+	'''
+
+	sizes = getSizes(iObj)
+	sizes.sort()
+	
+	return sizes
+
+
 # ###################################################################################################################
 def getDirection(iObj):
 	'''
@@ -1251,55 +1446,33 @@ def getDirection(iObj):
 		Returns iType: "XY", "YX", "XZ", "ZX", "YZ", "ZY"
 	'''
 
-	if iObj.isDerivedFrom("Part::Box"):
-		
-		if (
-			iObj.Height.Value < iObj.Width.Value and iObj.Height.Value < iObj.Length.Value and 
-			iObj.Width.Value <= iObj.Length.Value
-			):
-			return "XY"
-		
-		if (
-			iObj.Height.Value < iObj.Width.Value and iObj.Height.Value < iObj.Length.Value and 
-			iObj.Width.Value > iObj.Length.Value
-			):
-			return "YX"
-		
-		if (
-			iObj.Width.Value < iObj.Height.Value and iObj.Width.Value < iObj.Length.Value and 
-			iObj.Height.Value <= iObj.Length.Value
-			):
-			return "XZ"
-			
-		if (
-			iObj.Width.Value < iObj.Height.Value and iObj.Width.Value < iObj.Length.Value and 
-			iObj.Height.Value > iObj.Length.Value
-			):
-			return "ZX"
-			
-		if (
-			iObj.Length.Value < iObj.Height.Value and iObj.Length.Value < iObj.Width.Value and 
-			iObj.Height.Value <= iObj.Width.Value
-			):
+	if isType(iObj, "Part::Box"):
+		
+		L, W, H = iObj.Length.Value, iObj.Width.Value, iObj.Height.Value
+		
+		# thickness is the smallest size, for profiles with 2 equal sizes 
+		# the Height is taken as thickness first, next the Width
+		
+		# thickness is Height
+		if H <= W and H <= L:
+			if W <= L:
+				return "XY"
+			else:
+				return "YX"
+		
+		# thickness is Width
+		if W <= L:
+			if H <= L:
+				return "XZ"
+			else:
+				return "ZX"
+		
+		# thickness is Length
+		if H <= W:
 			return "YZ"
-			
-		if (
-			iObj.Length.Value < iObj.Height.Value and iObj.Length.Value < iObj.Width.Value and 
-			iObj.Height.Value > iObj.Width.Value
-			):
+		else:
 			return "ZY"
 
-		# for profiles with 2 equal sizes
-		
-		if iObj.Height.Value == iObj.Width.Value and iObj.Length.Value >= iObj.Height.Value:
-			return "XY"
-			
-		if iObj.Length.Value == iObj.Height.Value and iObj.Width.Value > iObj.Height.Value:
-			return "YX"
-			
-		if iObj.Length.Value == iObj.Width.Value and iObj.Height.Value > iObj.Width.Value:
-			return "ZX"
-
 	else:
 		
 		ref = iObj.Profile[0].Support[0][0]
@@ -1354,18 +1527,12 @@ def convertPosition(iObj, iX, iY, iZ):
 		For Pad object in XZ direction return the AttachmentOffset order [ 0, 0, -400 ]
 	'''
 	
-	if iObj.isDerivedFrom("PartDesign::Pad"):
+	if isType(iObj, "PartDesign::Pad"):
 		
 		direction = getDirection(iObj)
 		
-		if direction == "XY" or direction == "YX":
-			return [ iX, iY, iZ ]
-		
-		if direction == "XZ" or direction == "ZX":
-			return [ iX, iZ, -iY ]
-
-		if direction == "YZ" or direction == "ZY":
-			return [ iY, iZ, iX ]
+		values = { "X": iX, "Y": iY, "Z": iZ, "-Y": -iY }
+		return [ values[v] for v in gPadPositions[direction] ]
 	
 	else:
 		
@@ -1395,57 +1562,79 @@ def sizesToCubePanel(iObj, iType):
 		Returns [ Length, Width, Height ] for YZ object placement".
 	'''
 
-	if iObj.isDerivedFrom("Part::Box"):
-
-		sizes = [ iObj.Length.Value, iObj.Width.Value, iObj.Height.Value ]
-		
-	elif iObj.isDerivedFrom("PartDesign::Pad"):
+	# panels sizes the same as for getSizes, other objects need to have Base sizes, there is no default
+	if isType(iObj, "Part::Box") or isType(iObj, "PartDesign::Pad"):
 		
-		for c in iObj.Profile[0].Constraints:
-			if c.Name == "SizeX":
-				sizeX = c.Value
-			if c.Name == "SizeY":
-				sizeY = c.Value
-		
-		sizes = [ iObj.Length.Value, sizeX, sizeY ]
+		sizes = getSortedSizes(iObj)
 	
 	else:
 		
 		sizes = [ iObj.Base_Length.Value, iObj.Base_Width.Value, iObj.Base_Height.Value ]
+		sizes.sort()
 
-	sizes.sort()
-
-	if iType == "XY":
-		Length = sizes[2]
-		Width = sizes[1]
-		Height = sizes[0]
-
-	if iType == "YX":
-		Length = sizes[1]
-		Width = sizes[2]
-		Height = sizes[0]
+	[ Length, Width, Height ] = [ sizes[i] for i in gCubeOrder[iType] ]
 
-	if iType == "XZ":
-		Length = sizes[2]
-		Width = sizes[0]
-		Height = sizes[1]
+	return [ Length, Width, Height ]
 
-	if iType == "ZX":
-		Length = sizes[1]
-		Width = sizes[0]
-		Height = sizes[2]
 
-	if iType == "YZ":
-		Length = sizes[0]
-		Width = sizes[2]
-		Height = sizes[1]
+# ###################################################################################################################
+def makePanels(iPanels):
+	'''
+	makePanels(iPanels) - allows to create many Cube panels at once with single recompute at the end.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iPanels: list of [ iType, iObj ], where iType is panel direction "XY", "YX", "XZ", "ZX", "YZ", "ZY" 
+			and iObj is object to copy sizes from, or empty string "" for default panel 600 x 300 x 18
 
-	if iType == "ZY":
-		Length = sizes[0]
-		Width = sizes[1]
-		Height = sizes[2]
+	Usage:
+	
+		import MagicPanels
+		panels = MagicPanels.makePanels([ [ "XY", "" ], [ "YZ", obj ] ])
+		
+	Result:
+	
+		Array of created panels will be returned.
+	'''
+	
+	doc = FreeCAD.activeDocument()
 
-	return [ Length, Width, Height ]
+	# get all sizes first, so nothing is created if any object is not supported
+	sizes = []
+	
+	for [ iType, iObj ] in iPanels:
+		
+		if iObj == "":
+			sizes.append([ gDefaultSizes[i] for i in gCubeOrder[iType] ])
+		else:
+			sizes.append(sizesToCubePanel(iObj, iType))
+	
+	panels = []
+	
+	# all panels as single undo step, if the caller has open transaction the panels are part of it
+	owner = not doc.HasPendingTransaction
+	if owner:
+		doc.openTransaction("makePanels")
+	
+	try:
+		for [ iType, iObj ], [ L, W, H ] in zip(iPanels, sizes):
+			
+			panel = doc.addObject("Part::Box", "panel"+iType)
+			panel.Length, panel.Width, panel.Height = L, W, H
+			panels.append(panel)
+	except:
+		if owner:
+			doc.abortTransaction()
+		raise
+	
+	if owner:
+		doc.commitTransaction()
+	
+	doc.recompute()
+	
+	return panels
 
 
 # ###################################################################################################################
@@ -1467,45 +1656,44 @@ def makeCuts(iObjects):
 		
 	Result:
 	
-		Array of cut objects will be returned.
+		Array with single cut object will be returned. If there is more than one tool object, the copies 
+		are fused into Part::MultiFuse object and used as Tool for the Cut.
 	'''
 	
-	cuts = []
-	
-	i = 0
-	for o in iObjects:
-		
-		i = i + 1
-		
-		if i == 1:
-			base = o
-			baseName = str(base.Name)
-			baseLabel = str(base.Label)
-			continue
+	doc = FreeCAD.activeDocument()
 
-		copy = FreeCAD.ActiveDocument.copyObject(o)
+	base = iObjects[0]
+	baseName = str(base.Name)
+	baseLabel = str(base.Label)
+	
+	tools = []
+	for o in iObjects[1:]:
+		copy = doc.copyObject(o)
 		copy.Label = "copy, " + o.Label
-		
-		cutName = baseName + str(i-1)
-		cut = FreeCAD.ActiveDocument.addObject("Part::Cut", cutName)
-		cut.Base = base
-		cut.Tool = copy
-		cut.Label = "Cut " + str(i-1) + ", " + baseLabel
-		
-		FreeCAD.activeDocument().recompute()
-		
-		base = cut
-		cuts.append(cut)
-		
-	cut.Label = "Cut, " + baseLabel
+		tools.append(copy)
+
+	# fuse all tools to cut the base by single bool operation, instead of chain of cuts
+	if len(tools) == 1:
+		tool = tools[0]
+	else:
+		tool = doc.addObject("Part::MultiFuse", baseName + "Tools")
+		tool.Shapes = tools
+		tool.Label = "Tools, " + baseLabel
 
-	return cuts
+	cut = doc.addObject("Part::Cut", baseName + "Cut")
+	cut.Base = base
+	cut.Tool = tool
+	cut.Label = "Cut, " + baseLabel
+	
+	doc.recompute()
+	
+	return [ cut ]
 
 
 # ###################################################################################################################
-def makePad(iObj, iPadLabel="Pad"):
+def makePad(iObj, iPadLabel="Pad", iRecompute=True):
 	'''
-	makePad(iObj, iPadLabel="Pad") - allows to create Part, Plane, Body, Pad, Sketch objects.
+	makePad(iObj, iPadLabel="Pad", iRecompute=True) - allows to create Part, Plane, Body, Pad, Sketch objects.
 	
 	Note: This is internal function, so there is no error pop-up or any error handling.
 	
@@ -1513,6 +1701,7 @@ def makePad(iObj, iPadLabel="Pad"):
 	
 		iObj: object Cube to change into Pad
 		iPadLabel: Label for the new created Pad, the Name will be Pad
+		iRecompute (optional): set False to not recompute the document, if you recompute it later anyway
 		
 	Usage:
 	
@@ -1524,32 +1713,58 @@ def makePad(iObj, iPadLabel="Pad"):
 		Created Pad with correct placement, rotation and return [ part, body, sketch, pad ].
 	'''
 
-	sizes = getSizes(iObj)
-	sizes.sort()
+	sizes = getSortedSizes(iObj)
 	
 	direction = getDirection(iObj)
 	
-	if direction == "XY" or direction == "XZ" or direction == "YZ":
+	# sizes are already sorted, so only change the order
+	if direction in gLongSizeX:
 		s = [ sizes[2], sizes[1], sizes[0] ]
-	
-	if direction == "YX" or direction == "ZX" or direction == "ZY":
+	else:
 		s = [ sizes[1], sizes[2], sizes[0] ]
 
 	[ X, Y, Z, r ] = getPlacement(iObj)
 	
-	if direction == "XY" or direction == "YX":
-		[ x, y, z ] = [ X, Y, Z ]
+	# the same order as for convertPosition, but the Sketch for XZ is at the other side of the thickness
+	values = { "X": X, "Y": Y, "Z": Z, "-Y": -(Y+sizes[0]) }
+	[ x, y, z ] = [ values[v] for v in gPadPositions[direction] ]
 	
-	if direction == "XZ" or direction == "ZX":
-		[ x, y, z ] = [ X, Z, -(Y+sizes[0]) ]
+	return makePadFromSizes(s, x, y, z, r, direction, iPadLabel, iRecompute)
+
 
-	if direction == "YZ" or direction == "ZY":
-		[ x, y, z ] = [ Y, Z, X ]
+# ###################################################################################################################
+def makePadFromSizes(iSizes, iX, iY, iZ, iR, iDirection="XY", iPadLabel="Pad", iRecompute=True):
+	'''
+	makePadFromSizes(iSizes, iX, iY, iZ, iR, iDirection="XY", iPadLabel="Pad", iRecompute=True) - allows to create Part, Body, Pad, Sketch objects 
+	directly from sizes and Sketch position, without any Cube object.
+	
+	Note: This is internal function, so there is no error pop-up or any error handling.
+	
+	Args:
+	
+		iSizes: array with [ SizeX, SizeY, Length ], Sketch sizes and Pad length
+		iX, iY, iZ: Sketch position at the plane
+		iR: Sketch rotation
+		iDirection (optional): Sketch plane "XY", "XZ" or "YZ"
+		iPadLabel (optional): Label for the new created Pad, the Name will be Pad
+		iRecompute (optional): set False to not recompute the document, if you recompute it later anyway
+		
+	Usage:
 	
-	import Part, PartDesign
-	import Sketcher
-	import PartDesignGui
+		import MagicPanels
+		MagicPanels.makePadFromSizes([ 100, 50, 18 ], 0, 0, 0, FreeCAD.Rotation(0, 0, 0), "XY", "myPanel")
+		
+	Result:
+	
+		Created Pad with correct placement, rotation and return [ part, body, sketch, pad ].
+	'''
 
+	# PartDesign is needed only to create Body and Pad, so do not load it at workbench start
+	import PartDesign, PartDesignGui
+
+	s = iSizes
+	direction = iDirection
+	
 	doc = FreeCAD.ActiveDocument
 	
 	part = doc.addObject('App::Part', 'Part')
@@ -1562,44 +1777,40 @@ def makePad(iObj, iPadLabel="Pad"):
 	sketch = body.newObject('Sketcher::SketchObject', 'Sketch')
 	sketch.Label = "Pattern, "+iPadLabel
 	
-	if direction == "XY" or direction == "YX":
-		sketch.Support = (body.Origin.OriginFeatures[3])
-	if direction == "XZ" or direction == "ZX":
-		sketch.Support = (body.Origin.OriginFeatures[4])
-	if direction == "YZ" or direction == "ZY":
-		sketch.Support = (body.Origin.OriginFeatures[5])
+	sketch.Support = (body.Origin.OriginFeatures[gPadSupports[direction]])
 
 	sketch.MapMode = 'FlatFace'
 
-	geoList = []
-	geoList.append(Part.LineSegment(FreeCAD.Vector(115.695488,159.435455,0),FreeCAD.Vector(274.784485,159.435455,0)))
-	geoList.append(Part.LineSegment(FreeCAD.Vector(274.784485,159.435455,0),FreeCAD.Vector(274.784485,53.166523,0)))
-	geoList.append(Part.LineSegment(FreeCAD.Vector(274.784485,53.166523,0),FreeCAD.Vector(115.695488,53.166523,0)))
-	geoList.append(Part.LineSegment(FreeCAD.Vector(115.695488,53.166523,0),FreeCAD.Vector(115.695488,159.435455,0)))
-	sketch.addGeometry(geoList,False)
+	# sketch copies the geometry and constraints so the template can be reused
+	if len(gPadGeometry) == 0:
+		gPadGeometry.append(Part.LineSegment(FreeCAD.Vector(115.695488,159.435455,0),FreeCAD.Vector(274.784485,159.435455,0)))
+		gPadGeometry.append(Part.LineSegment(FreeCAD.Vector(274.784485,159.435455,0),FreeCAD.Vector(274.784485,53.166523,0)))
+		gPadGeometry.append(Part.LineSegment(FreeCAD.Vector(274.784485,53.166523,0),FreeCAD.Vector(115.695488,53.166523,0)))
+		gPadGeometry.append(Part.LineSegment(FreeCAD.Vector(115.695488,53.166523,0),FreeCAD.Vector(115.695488,159.435455,0)))
+		
+		gPadConstraints.append(Sketcher.Constraint('Coincident',0,2,1,1))
+		gPadConstraints.append(Sketcher.Constraint('Coincident',1,2,2,1))
+		gPadConstraints.append(Sketcher.Constraint('Coincident',2,2,3,1))
+		gPadConstraints.append(Sketcher.Constraint('Coincident',3,2,0,1))
+		gPadConstraints.append(Sketcher.Constraint('Horizontal',0))
+		gPadConstraints.append(Sketcher.Constraint('Horizontal',2))
+		gPadConstraints.append(Sketcher.Constraint('Vertical',1))
+		gPadConstraints.append(Sketcher.Constraint('Vertical',3))
+
+	# add all constraints at once with the final sizes, so the sketch is solved only once
+	constraints = list(gPadConstraints)
+	constraints.append(Sketcher.Constraint('Coincident',2,2,-1,1))
+	constraints.append(Sketcher.Constraint('DistanceX',0,1,0,2,s[0]))
+	constraints.append(Sketcher.Constraint('DistanceY',3,1,3,2,s[1]))
+
+	sketch.addGeometry(gPadGeometry,False)
+	sketch.addConstraint(constraints)
 	
-	conList = []
-	conList.append(Sketcher.Constraint('Coincident',0,2,1,1))
-	conList.append(Sketcher.Constraint('Coincident',1,2,2,1))
-	conList.append(Sketcher.Constraint('Coincident',2,2,3,1))
-	conList.append(Sketcher.Constraint('Coincident',3,2,0,1))
-	conList.append(Sketcher.Constraint('Horizontal',0))
-	conList.append(Sketcher.Constraint('Horizontal',2))
-	conList.append(Sketcher.Constraint('Vertical',1))
-	conList.append(Sketcher.Constraint('Vertical',3))
-	sketch.addConstraint(conList)
-	del geoList, conList
-
-	sketch.addConstraint(Sketcher.Constraint('Coincident',2,2,-1,1))
-	sketch.addConstraint(Sketcher.Constraint('DistanceX',0,1,0,2,274.784485))
-	sketch.setDatum(9,FreeCAD.Units.Quantity(s[0]))
 	sketch.renameConstraint(9, u'SizeX')
-	sketch.addConstraint(Sketcher.Constraint('DistanceY',3,1,3,2,159.435455))
-	sketch.setDatum(10,FreeCAD.Units.Quantity(s[1]))
 	sketch.renameConstraint(10, u'SizeY')
 
-	position = FreeCAD.Vector(x, y, z)
-	sketch.AttachmentOffset = FreeCAD.Placement(position, r)
+	position = FreeCAD.Vector(iX, iY, iZ)
+	sketch.AttachmentOffset = FreeCAD.Placement(position, iR)
 
 	pad = body.newObject('PartDesign::Pad', "Pad")
 	pad.Label = iPadLabel
@@ -1607,9 +1818,104 @@ def makePad(iObj, iPadLabel="Pad"):
 	pad.Length = FreeCAD.Units.Quantity(s[2])
 	sketch.Visibility = False
 
-	doc.recompute()
+	if iRecompute:
+		doc.recompute()
+
+	return [ part, body, sketch, pad ]
+
+
+# ###################################################################################################################
+def makeBody(iObj):
+	'''
+	makeBody(iObj) - allows to get Body for object to drill. If the object is Cube it will be replaced with Pad.
+
+	Note: This is internal function, so there is no error pop-up or any error handling.
+
+	Args:
+
+		iObj: base object to drill, Cube or Pad
+
+	Usage:
+
+		import MagicPanels
+		body = MagicPanels.makeBody(obj)
+		
+	Result:
+
+		Return Body object for base object.
+	'''
+
+	doc = FreeCAD.activeDocument()
+
+	if isType(iObj, "Part::Box"):
+		
+		[ part, body, sketch, pad ] = makePad(iObj, iObj.Label, False)
+		doc.removeObject(iObj.Name)
+		doc.recompute()
+	
+	else:
+		
+		body = iObj._Body
+
+	return body
+
+
+# ###################################################################################################################
+def makeHoleSketch(iBody, iObj, iCircles):
+	'''
+	makeHoleSketch(iBody, iObj, iCircles) - allows to create Sketch for hole at drill bit position.
+
+	Note: This is internal function, so there is no error pop-up or any error handling.
+
+	Args:
+
+		iBody: Body object for the Sketch
+		iObj: drill bit object, Cylinder or Cone
+		iCircles: list of [ diameter, constraint name ], the first circle is the hole, 
+			all other circles are created as construction geometry
+
+	Usage:
+
+		import MagicPanels
+		sketch = MagicPanels.makeHoleSketch(body, cone, [ [ 6, "Hole00Diameter" ], [ 10, "Countersink00Diameter" ] ])
+		
+	Result:
+
+		Return Sketch object with circles at the drill bit placement.
+	'''
+
+	holeSketch = iBody.newObject('Sketcher::SketchObject','Sketch')
+	holeSketch.MapMode = 'FlatFace'
 
-	return [ part, body, sketch, pad ]
+	axis = iObj.Placement.Rotation.Axis
+	
+	geoList = []
+	conList = []
+	
+	i = 0
+	for [ d, name ] in iCircles:
+		
+		geoList.append(Part.Circle(FreeCAD.Vector(0, 0, 0), axis, d / 2))
+		conList.append(Sketcher.Constraint('Coincident', i, 3, -1, 1))
+		conList.append(Sketcher.Constraint('Diameter', i, float(d)))
+		i = i + 1
+	
+	# add all at once to solve the Sketch once, other circles are construction geometry
+	holeSketch.addGeometry(geoList[0], False)
+	if len(geoList) > 1:
+		holeSketch.addGeometry(geoList[1:], True)
+	
+	holeSketch.addConstraint(conList)
+	
+	i = 0
+	for [ d, name ] in iCircles:
+		holeSketch.renameConstraint(2*i+1, name)
+		i = i + 1
+	
+	# set position to hole Sketch, drill bits use Placement the same way as Sketch
+	holeSketch.Placement = FreeCAD.Placement(iObj.Placement)
+	
+	return holeSketch
 
 
 # ###################################################################################################################
@@ -1635,8 +1941,6 @@ def makeHoles(iObj, iFace, iCylinders):
 		Make holes and return list of holes.
 	'''
 
-	import Part, Sketcher
-
 	holes = []
 
 	base = iObj
@@ -1644,40 +1948,13 @@ def makeHoles(iObj, iFace, iCylinders):
 	objects = iCylinders
 
 	# set body for base object
-	if base.isDerivedFrom("Part::Box"):
-		
-		[ part, body, sketch, pad ] = makePad(base, base.Label)
-		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.activeDocument().recompute()
-	
-	else:
-		
-		body = base._Body
+	body = makeBody(base)
 
 	# loop in drill bits and drill holes
 	for o in objects:
 		
 		# create hole Sketch
-		holeSketch = body.newObject('Sketcher::SketchObject','Sketch')
-		holeSketch.MapMode = 'FlatFace'
-
-		axis = o.Placement.Rotation.Axis
-		circleGeo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, o.Radius)
-		holeSketch.addGeometry(circleGeo, False)
-		
-		holeSketch.addConstraint(Sketcher.Constraint('Coincident', 0, 3, -1, 1)) 
-		holeSketch.addConstraint(Sketcher.Constraint('Diameter', 0, 2 * o.Radius)) 
-		s = str(float(2 * o.Radius))+" mm"
-		holeSketch.setDatum(1, FreeCAD.Units.Quantity(s))
-		holeSketch.renameConstraint(1, u'Hole00Diameter')
-		
-		FreeCAD.ActiveDocument.recompute()
-		
-		# set position to hole Sketch
-		[ x, y, z, r ] = getPlacement(o)
-		setPlacement(holeSketch, x, y, z, r)
-		
-		FreeCAD.ActiveDocument.recompute()
+		holeSketch = makeHoleSketch(body, o, [ [ 2 * o.Radius, u'Hole00Diameter' ] ])
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Hole')
@@ -1699,11 +1976,12 @@ def makeHoles(iObj, iFace, iCylinders):
 		hole.DrillForDepth = 1
 		hole.Tapered = 0
 		
-		FreeCAD.ActiveDocument.recompute()
-		
 		base = hole
 		holes.append(hole)
 
+	# single recompute for all holes, the holes chain will be computed in order
+	FreeCAD.ActiveDocument.recompute()
+
 	return holes
 	
 
@@ -1730,8 +2008,6 @@ def makeCountersinks(iObj, iFace, iCones):
 		Make holes and return list of holes. 
 	'''
 
-	import Part, Sketcher
-
 	holes = []
 
 	base = iObj
@@ -1739,51 +2015,16 @@ def makeCountersinks(iObj, iFace, iCones):
 	objects = iCones
 		
 	# set body for base object
-	if base.isDerivedFrom("Part::Box"):
-		
-		[ part, body, sketch, pad ] = makePad(base, base.Label)
-		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.activeDocument().recompute()
-	
-	else:
-		
-		body = base._Body
+	body = makeBody(base)
 	
 	for o in objects:
 		
-		# create hole Sketch
-		holeSketch = body.newObject('Sketcher::SketchObject','Sketch')
-		holeSketch.MapMode = 'FlatFace'
-
-		axis = o.Placement.Rotation.Axis
 		r1 = float(2 * o.Radius1)
 		r2 = float(2 * o.Radius2)
-		sr1 = str(r1)+" mm"
-		sr2 = str(r2)+" mm"
-		
-		# set hole
-		geo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, r1)
-		holeSketch.addGeometry(geo, False)
-		holeSketch.addConstraint(Sketcher.Constraint('Coincident', 0, 3, -1, 1))
-		holeSketch.addConstraint(Sketcher.Constraint('Diameter', 0, r1)) 
-		holeSketch.setDatum(1, FreeCAD.Units.Quantity(sr1))
-		holeSketch.renameConstraint(1, u'Hole00Diameter')
-		
-		# set countersink
-		geo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, r2)
-		holeSketch.addGeometry(geo, True)
-		holeSketch.addConstraint(Sketcher.Constraint('Coincident', 1, 3, -1, 1)) 
-		holeSketch.addConstraint(Sketcher.Constraint('Diameter', 1, r2)) 
-		holeSketch.setDatum(3, FreeCAD.Units.Quantity(sr2))
-		holeSketch.renameConstraint(3, u'Countersink00Diameter')
-		
-		FreeCAD.ActiveDocument.recompute()
 		
-		# set position to hole Sketch
-		[ x, y, z, r ] = getPlacement(o)
-		setPlacement(holeSketch, x, y, z, r)
-		
-		FreeCAD.ActiveDocument.recompute()
+		# create hole Sketch with hole and countersink circles
+		circles = [ [ r1, u'Hole00Diameter' ], [ r2, u'Countersink00Diameter' ] ]
+		holeSketch = makeHoleSketch(body, o, circles)
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Countersink')
@@ -1805,11 +2046,12 @@ def makeCountersinks(iObj, iFace, iCones):
 		hole.DrillForDepth = 1
 		hole.Tapered = 0
 		
-		FreeCAD.ActiveDocument.recompute()
-		
 		base = hole
 		holes.append(hole)
-		
+	
+	# single recompute for all holes, the holes chain will be computed in order
+	FreeCAD.ActiveDocument.recompute()
+	
 	return holes
 	
 
@@ -1836,8 +2078,6 @@ def makeCounterbores(iObj, iFace, iCones):
 		Make holes and return list of holes. 
 	'''
 
-	import Part, Sketcher
-
 	holes = []
 
 	base = iObj
@@ -1845,51 +2085,16 @@ def makeCounterbores(iObj, iFace, iCones):
 	objects = iCones
 		
 	# set body for base object
-	if base.isDerivedFrom("Part::Box"):
-		
-		[ part, body, sketch, pad ] = makePad(base, base.Label)
-		FreeCAD.ActiveDocument.removeObject(base.Name)
-		FreeCAD.activeDocument().recompute()
-	
-	else:
-		
-		body = base._Body
+	body = makeBody(base)
 
 	for o in objects:
 		
-		# create hole Sketch
-		holeSketch = body.newObject('Sketcher::SketchObject','Sketch')
-		holeSketch.MapMode = 'FlatFace'
-
-		axis = o.Placement.Rotation.Axis
 		r1 = float(2 * o.Radius1)
 		r2 = float(2 * o.Radius2)
-		sr1 = str(r1)+" mm"
-		sr2 = str(r2)+" mm"
-		
-		# set hole
-		geo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, r1)
-		holeSketch.addGeometry(geo, False)
-		holeSketch.addConstraint(Sketcher.Constraint('Coincident', 0, 3, -1, 1))
-		holeSketch.addConstraint(Sketcher.Constraint('Diameter', 0, r1)) 
-		holeSketch.setDatum(1, FreeCAD.Units.Quantity(sr1))
-		holeSketch.renameConstraint(1, u'Hole00Diameter')
-		
-		# set counterbore
-		geo = Part.Circle(FreeCAD.Vector(0, 0, 0), axis, r2)
-		holeSketch.addGeometry(geo, True)
-		holeSketch.addConstraint(Sketcher.Constraint('Coincident', 1, 3, -1, 1)) 
-		holeSketch.addConstraint(Sketcher.Constraint('Diameter', 1, r2)) 
-		holeSketch.setDatum(3, FreeCAD.Units.Quantity(sr2))
-		holeSketch.renameConstraint(3, u'Counterbore00Diameter')
-		
-		FreeCAD.ActiveDocument.recompute()
 		
-		# set position to hole Sketch
-		[ x, y, z, r ] = getPlacement(o)
-		setPlacement(holeSketch, x, y, z, r)
-		
-		FreeCAD.ActiveDocument.recompute()
+		# create hole Sketch with hole and counterbore circles
+		circles = [ [ r1, u'Hole00Diameter' ], [ r2, u'Counterbore00Diameter' ] ]
+		holeSketch = makeHoleSketch(body, o, circles)
 		
 		# create hole object
 		hole = body.newObject('PartDesign::Hole','Counterbore')
@@ -1909,11 +2114,12 @@ def makeCounterbores(iObj, iFace, iCones):
 		hole.DrillPoint = 0
 		hole.Tapered = 0
 		
-		FreeCAD.ActiveDocument.recompute()
-		
 		base = hole
 		holes.append(hole)
-		
+	
+	# single recompute for all holes, the holes chain will be computed in order
+	FreeCAD.ActiveDocument.recompute()
+	
 	return holes
 
 
@@ -1939,60 +2145,71 @@ def showInfo(iCaller, iInfo, iNote="yes"):
 		Show info Gui.
 	'''
 
-	info = ""
+	info = []
+	
+	import os
 	
-	import os, sys
-	import fakemodule
-	path = os.path.dirname(fakemodule.__file__)
-	iconPath = str(os.path.join(path, "Icons"))
+	global gIconPath
+	
+	if gIconPath == "":
+		
+		# set the globals only if the icons are listed, otherwise try again at next call
+		try:
+			import fakemodule
+			path = str(os.path.join(os.path.dirname(fakemodule.__file__), "Icons"))
+			gIconFiles.update(os.listdir(path))
+			gIconPath = path
+		except:
+			pass
 	
 	filename = ""
 	
-	info += '<table cellpadding="5" border="0" text-align="left">'
-	info += '<tr>'
+	info.append('<table cellpadding="5" border="0" text-align="left">')
+	info.append('<tr>')
 	
-	info += '<td>'
-	info += iInfo
-	info += '</td>'
+	info.append('<td>')
+	info.append(iInfo)
+	info.append('</td>')
 	
-	info += '<td>'
+	info.append('<td>')
 	
-	f = os.path.join(iconPath, iCaller+".xpm")
-	if os.path.exists(f):
-		filename = f
-		info += '<img src="'+ filename + '" width="200" height="200" align="right"/>'
+	if iCaller+".xpm" in gIconFiles:
+		filename = os.path.join(gIconPath, iCaller+".xpm")
+		info.append('<img src="'+ filename + '" width="200" height="200" align="right"/>')
 	
-	f = os.path.join(iconPath, iCaller+".svg")
-	if os.path.exists(f):
-		filename = f
-		info += '<svg>'
-		info += '<img src="'+ filename + '" width="200" height="200" align="right"/>'
-		info += '</svg>'
+	if iCaller+".svg" in gIconFiles:
+		filename = os.path.join(gIconPath, iCaller+".svg")
+		info.append('<svg>')
+		info.append('<img src="'+ filename + '" width="200" height="200" align="right"/>')
+		info.append('</svg>')
 		
-	f = os.path.join(iconPath, iCaller+".png")
-	if os.path.exists(f):
-		filename = f
-		info += '<img src="'+ filename + '" width="200" height="200" align="right">'
+	if iCaller+".png" in gIconFiles:
+		filename = os.path.join(gIconPath, iCaller+".png")
+		info.append('<img src="'+ filename + '" width="200" height="200" align="right">')
 	
-	info += '</td>'
+	info.append('</td>')
 	
-	info += '</tr>'
-	info += '</table>'
+	info.append('</tr>')
+	info.append('</table>')
 
 
 	if iNote == "yes":
 		
-		info += '<br><br>'
-		info += translate('showInfoAll', 'Please see:')
-		info += ' ' + '<a href="https://github.com/dprojects/Woodworking/tree/master/Docs">'
-		info += translate('showInfoAll', 'Woodworking workbench documentation')
-		info += '</a>'
-		info += translate('showInfoAll', ' for features description and detailed tutorials.')
-		
+		info.append('<br><br>')
+		info.append(translate('showInfoAll', 'Please see:'))
+		info.append(' ' + '<a href="https://github.com/dprojects/Woodworking/tree/master/Docs">')
+		info.append(translate('showInfoAll', 'Woodworking workbench documentation'))
+		info.append('</a>')
+		info.append(translate('showInfoAll', ' for features description and detailed tutorials.'))
+	
+	# Qt is needed only for the pop-up, so do not load it for scripts without errors
+	from PySide import QtGui
+	from PySide import QtCore
+	
 	msg = QtGui.QMessageBox()
 	msg.setWindowTitle(iCaller)
 	msg.setTextFormat(QtCore.Qt.TextFormat.RichText)
-	msg.setText(info)
+	msg.setText("".join(info))
 	msg.exec_()
 
 
@@ -2031,39 +2248,7 @@ def panelDefault(iType):
 
 	try:
 
-		panel = FreeCAD.activeDocument().addObject("Part::Box", "panel"+iType)
-
-		if iType == "XY":
-			panel.Length = 600
-			panel.Width = 300
-			panel.Height = 18
-
-		if iType == "YX":
-			panel.Length = 300
-			panel.Width = 600
-			panel.Height = 18
-
-		if iType == "XZ":
-			panel.Length = 600
-			panel.Width = 18
-			panel.Height = 300
-
-		if iType == "ZX":
-			panel.Length = 300
-			panel.Width = 18
-			panel.Height = 600
-
-		if iType == "YZ":
-			panel.Length = 18
-			panel.Width = 600
-			panel.Height = 300
-
-		if iType == "ZY":
-			panel.Length = 18
-			panel.Width = 300
-			panel.Height = 600
-
-		FreeCAD.activeDocument().recompute()
+		makePanels([ [ iType, "" ] ])
 	
 	except:
 	
@@ -2100,12 +2285,7 @@ def panelCopy(iType):
 
 		gObj = getReference()
 		
-		[ Length, Width, Height ] = sizesToCubePanel(gObj, iType)
-		
-		panel = FreeCAD.activeDocument().addObject("Part::Box", "panel"+iType)
-		[ panel.Length, panel.Width, panel.Height ] = [ Length, Width, Height ]
-		
-		FreeCAD.activeDocument().recompute()
+		makePanels([ [ iType, gObj ] ])
 
 	except:
 
@@ -2144,31 +2324,13 @@ def panelMove(iType):
 
 		gObj = getReference()
 
-		sizes = []
-		sizes = getSizes(gObj)
-		sizes.sort()
+		thick = min(getSizes(gObj))
 
-		x = 0
-		y = 0
-		z = 0
+		[ axis, sign ] = gMoveSteps[iType]
 		
-		if iType == "Xp":
-			x = sizes[0]
-		
-		if iType == "Xm":
-			x = - sizes[0]
-
-		if iType == "Yp":
-			y = sizes[0]
-
-		if iType == "Ym":
-			y = - sizes[0]
-
-		if iType == "Zp":
-			z = sizes[0]
-
-		if iType == "Zm":
-			z = - sizes[0]
+		move = [ 0, 0, 0 ]
+		move[axis] = sign * thick
+		[ x, y, z ] = move
 
 		[ x, y, z ] = convertPosition(gObj, x, y, z)
 		[ x, y, z ] = getModelRotation(x, y, z)
@@ -2212,49 +2374,30 @@ def panelMove2Face():
 
 	try:
 	
-		objects = FreeCADGui.Selection.getSelection()
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		objects = [ sx.Object for sx in selEx ]
 		
 		if len(objects) < 2:
 			raise
 		
-		i = 0
-		for o in objects:
-			
-			i = i + 1
-			
-			if i == 1:
+		gObj = objects[0]
+		gFace = getSelectedSubObject(selEx[0])
 
-				gObj = FreeCADGui.Selection.getSelection()[0]
-				gFace = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
+		gFPlane = getFacePlane(gFace)
+		v1 = getVertices(gFace, 1)[0]
+		axis = gFacePlaneAxis[gFPlane]
 
-				gFPlane = getFacePlane(gFace)
-				[ v1, v2, v3, v4 ] = getFaceVertices(gFace)
-
-				continue
+		for o in objects[1:]:
 			
 			obj = getReference(o)
 			
 			[ x, y, z, r ] = getPlacement(obj)
 			
-			if gFPlane == "XY":
-				X = x
-				Y = y
-				Z = v1[2]
-				R = r
-				
-			if gFPlane == "XZ":
-				X = x
-				Y = v1[1]
-				Z = z
-				R = r
-			
-			if gFPlane == "YZ":
-				X = v1[0]
-				Y = y
-				Z = z
-				R = r
-			
-			setPlacement(obj, X, Y, Z, R)
+			# move only along the axis perpendicular to the face
+			p = [ x, y, z ]
+			p[axis] = v1[axis]
+			
+			setPlacement(obj, p[0], p[1], p[2], r)
 			FreeCAD.activeDocument().recompute()
 			
 	except:
@@ -2295,179 +2438,53 @@ def panelResize(iType):
 
 		gObj = getReference()
 
-		sizes = []
-		sizes = getSizes(gObj)
-		sizes.sort()
+		sizes = getSortedSizes(gObj)
 		thick = sizes[0]
 
-		if gObj.isDerivedFrom("Part::Cylinder"):
-			
-			R, H = gObj.Radius.Value, gObj.Height.Value
-			
-			if iType == "1":
-				gObj.Height = gObj.Height.Value + thick
-
-			if iType == "2":
-				if H - thick > 0:
-					gObj.Height = gObj.Height.Value - thick
-
-			if iType == "3":
-				gObj.Radius = gObj.Radius.Value + thick
-				
-			if iType == "4":
-				if R - thick > 0:
-					gObj.Radius = gObj.Radius.Value - thick
-
-			if iType == "5":
-				gObj.Radius = gObj.Radius.Value + thick/2
+		# the panel thickness is resized by 1 mm, other sizes by thickness
+		[ rank, sign ] = gResizeRanks[iType]
+		step = thick if rank > 0 else 1
 
-			if iType == "6":
-				if R - thick/2 > 0:
-					gObj.Radius = gObj.Radius.Value - thick/2
-
-		if gObj.isDerivedFrom("Part::Cone"):
+		if isType(gObj, "Part::Cylinder") or isType(gObj, "Part::Cone"):
 			
-			R1, R2, H = gObj.Radius1.Value, gObj.Radius2.Value, gObj.Height.Value
+			if isType(gObj, "Part::Cylinder"):
+				[ attr, factor ] = gResizeSteps["Part::Cylinder"][iType]
+			else:
+				[ attr, factor ] = gResizeSteps["Part::Cone"][iType]
 			
-			if iType == "1":
-				gObj.Height = gObj.Height.Value + thick
-
-			if iType == "2":
-				if H - thick > 0:
-					gObj.Height = gObj.Height.Value - thick
-
-			if iType == "3":
-				gObj.Radius2 = gObj.Radius2.Value + thick/2
-
-			if iType == "4":
-				if R2 - thick/2 > 0:
-					gObj.Radius2 = gObj.Radius2.Value - thick/2
-
-			if iType == "5":
-				gObj.Radius1 = gObj.Radius1.Value + thick/2
+			v = getattr(gObj, attr).Value + factor * thick
+			if factor > 0 or v > 0:
+				setattr(gObj, attr, v)
 
-			if iType == "6":
-				if R1 - thick/2 > 0:
-					gObj.Radius1 = gObj.Radius1.Value - thick/2
-
-		if gObj.isDerivedFrom("Part::Box"):
+		elif isType(gObj, "Part::Box"):
 
 			L, W, H = gObj.Length.Value, gObj.Width.Value, gObj.Height.Value
-				
-			if iType == "1":
-				if L == sizes[2]:
-					gObj.Length = gObj.Length.Value + thick
-
-				if W == sizes[2]:
-					gObj.Width = gObj.Width.Value + thick
-					
-				if H == sizes[2]:
-					gObj.Height = gObj.Height.Value + thick
-
-			if iType == "2":
-				if L == sizes[2]:
-					if gObj.Length.Value - thick > 0:
-						gObj.Length = gObj.Length.Value - thick
-					
-				if W == sizes[2]:
-					if gObj.Width.Value - thick > 0:
-						gObj.Width = gObj.Width.Value - thick
-					
-				if H == sizes[2]:
-					if gObj.Height.Value - thick > 0:
-						gObj.Height = gObj.Height.Value - thick
-
-			if iType == "3":
-				if L == sizes[1]:
-					gObj.Length = gObj.Length.Value + thick
-
-				if W == sizes[1]:
-					gObj.Width = gObj.Width.Value + thick
-
-				if H == sizes[1]:
-					gObj.Height = gObj.Height.Value + thick
-
-			if iType == "4":
-				if L == sizes[1]:
-					if gObj.Length.Value - thick > 0:
-						gObj.Length = gObj.Length.Value - thick
-
-				if W == sizes[1]:
-					if gObj.Width.Value - thick > 0:
-						gObj.Width = gObj.Width.Value - thick
-
-				if H == sizes[1]:
-					if gObj.Height.Value - thick > 0:
-						gObj.Height = gObj.Height.Value - thick
-
-			if iType == "5":
-				if L == sizes[0]:
-					gObj.Length = gObj.Length.Value + 1
-
-				if W == sizes[0]:
-					gObj.Width = gObj.Width.Value + 1
-
-				if H == sizes[0]:
-					gObj.Height = gObj.Height.Value + 1
-
-			if iType == "6":
-				if L == sizes[0]:
-					if gObj.Length.Value - 1 > 0:
-						gObj.Length = gObj.Length.Value - 1
-
-				if W == sizes[0]:
-					if gObj.Width.Value - 1 > 0:
-						gObj.Width = gObj.Width.Value - 1
-
-				if H == sizes[0]:
-					if gObj.Height.Value - 1 > 0:
-						gObj.Height = gObj.Height.Value - 1
+			target = sizes[rank]
+			
+			for attr, v in [ [ "Length", L ], [ "Width", W ], [ "Height", H ] ]:
+				if v == target:
+					if sign > 0 or v - step > 0:
+						setattr(gObj, attr, v + sign * step)
 
-		if gObj.isDerivedFrom("PartDesign::Pad"):
-		
-			direction = getDirection(gObj)
-		
-			if iType == "1":
-				
-				if direction == "XY" or direction == "XZ" or direction == "YZ":
-					gObj.Profile[0].setDatum(9, FreeCAD.Units.Quantity(sizes[2] + thick))
-				else:
-					gObj.Profile[0].setDatum(10, FreeCAD.Units.Quantity(sizes[2] + thick))
+		elif isType(gObj, "PartDesign::Pad"):
 		
-			if sizes[2] - thick > 0:
-
-				if iType == "2":
+			if rank == 0:
 				
-					if direction == "XY" or direction == "XZ" or direction == "YZ":
-						gObj.Profile[0].setDatum(9, FreeCAD.Units.Quantity(sizes[2] - thick))
-					else:
-						gObj.Profile[0].setDatum(10, FreeCAD.Units.Quantity(sizes[2] - thick))
-
-			if iType == "3":
+				v = gObj.Length.Value + sign * step
+				if sign > 0 or v > 0:
+					gObj.Length = v
+			
+			else:
 				
-				if direction == "XY" or direction == "XZ" or direction == "YZ":
-					gObj.Profile[0].setDatum(10, FreeCAD.Units.Quantity(sizes[1] + thick))
+				# SizeX and SizeY constraint index for long and short side
+				if (getDirection(gObj) in gLongSizeX) == (rank == 2):
+					constraintId = 9
 				else:
-					gObj.Profile[0].setDatum(9, FreeCAD.Units.Quantity(sizes[1] + thick))
-
-			if sizes[1] - thick > 0:
-				
-				if iType == "4":
-				
-					if direction == "XY" or direction == "XZ" or direction == "YZ":
-						gObj.Profile[0].setDatum(10, FreeCAD.Units.Quantity(sizes[1] - thick))
-					else:
-						gObj.Profile[0].setDatum(9, FreeCAD.Units.Quantity(sizes[1] - thick))
-
-			if iType == "5":
+					constraintId = 10
 				
-				gObj.Length = gObj.Length.Value + 1
-			
-			if iType == "6":
-				
-				if gObj.Length.Value - 1 > 0:
-					gObj.Length = gObj.Length.Value - 1
-
+				v = sizes[rank] + sign * step
+				if sign > 0 or v > 0:
+					gObj.Profile[0].setDatum(constraintId, FreeCAD.Units.Quantity(v))
 			
 		FreeCAD.activeDocument().recompute()
 
@@ -2504,26 +2521,29 @@ def panelFace(iType):
 
 	try:
 
-		gSO = FreeCADGui.Selection.getSelection()[0]
+		doc = FreeCAD.activeDocument()
+
+		selEx = FreeCADGui.Selection.getSelectionEx()[0]
+		gSO = selEx.Object
 		
 		gObj = getReference(gSO)
-		gFace = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
+		gFace = getSelectedSubObject(selEx)
 		
 		[ L, W, H ] = sizesToCubePanel(gObj, iType)
 		
-		if gObj.isDerivedFrom("Part::Box"):
+		# read only the vertex needed for the selected object type
+		if isType(gSO, "Part::Cut"):
+			[ x, y, z ] = getVertex(gFace, 2, 0)
+		elif isType(gObj, "Part::Box"):
 			[ x, y, z ] = getVertex(gFace, 0, 1)
 		else:
 			[ x, y, z ] = getVertex(gFace, 1, 0)
-		
-		if gSO.isDerivedFrom("Part::Cut"):
-			[ x, y, z ] = getVertex(gFace, 2, 0)
 
-		panel = FreeCAD.activeDocument().addObject("Part::Box", "panelFace"+iType)
+		panel = doc.addObject("Part::Box", "panelFace"+iType)
 		panel.Length, panel.Width, panel.Height = L, W, H
 
-		panel.Placement = FreeCAD.Placement(FreeCAD.Vector(x, y, z), FreeCAD.Rotation(0, 0, 0))
-		FreeCAD.activeDocument().recompute()
+		panel.Placement.Base = FreeCAD.Vector(x, y, z)
+		doc.recompute()
 	
 	except:
 		
@@ -2558,11 +2578,13 @@ def panelBetween(iType):
 
 	try:
 
-		gSO = FreeCADGui.Selection.getSelection()[0]
-		gObj = getReference(gSO)
+		doc = FreeCAD.activeDocument()
+
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		gObj = getReference(selEx[0].Object)
 		
-		gFace1 = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		gFace2 = FreeCADGui.Selection.getSelectionEx()[1].SubObjects[0]
+		gFace1 = getSelectedSubObject(selEx[0])
+		gFace2 = getSelectedSubObject(selEx[1])
 	
 		[ x1, y1, z1 ] = getVertex(gFace1, 0, 1)
 		[ x2, y2, z2 ] = getVertex(gFace2, 0, 1)
@@ -2571,22 +2593,18 @@ def panelBetween(iType):
 		y = abs(y2 - y1)
 		z = abs(z2 - z1)
 
-		panel = FreeCAD.activeDocument().addObject("Part::Box", "panelBetween"+iType)
-		[ panel.Length, panel.Width, panel.Height ] = sizesToCubePanel(gObj, iType)
+		[ L, W, H ] = sizesToCubePanel(gObj, iType)
 
-		z1 = z1 + gObj.Height.Value - panel.Height.Value
-		
-		if x > 0:
-			panel.Length = x
+		z1 = z1 + gObj.Height.Value - H
 		
-		if y > 0:
-			panel.Width = y
-			
-		if z > 0:
-			panel.Height = z
+		# use the distance between faces if there is any, otherwise the default size
+		panel = doc.addObject("Part::Box", "panelBetween"+iType)
+		panel.Length = x if x > 0 else L
+		panel.Width = y if y > 0 else W
+		panel.Height = z if z > 0 else H
 
-		panel.Placement = FreeCAD.Placement(FreeCAD.Vector(x1, y1, z1), FreeCAD.Rotation(0, 0, 0))
-		FreeCAD.activeDocument().recompute()
+		panel.Placement.Base = FreeCAD.Vector(x1, y1, z1)
+		doc.recompute()
 
 	except:
 		
@@ -2622,14 +2640,19 @@ def panelSide(iType):
 		Created side of the furniture.
 	'''
 
+	# wrong iType is a bug in the caller, not a wrong selection, so do not show the selection info for it
+	if iType not in gSidePanels:
+		raise ValueError("panelSide: unknown iType " + str(iType))
+
 	try:
 
-		gObj = getReference()
-		gFace = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
+		selEx = FreeCADGui.Selection.getSelectionEx()[0]
+		gObj = getReference(selEx.Object)
+		gFace = getSelectedSubObject(selEx)
 
 		[ Length, Width, Height ] = sizesToCubePanel(gObj, "ZY")
 
-		if gObj.isDerivedFrom("Part::Box"):
+		if isType(gObj, "Part::Box"):
 			[ x, y, z ] = getVertex(gFace, 0, 1)
 
 		else:
@@ -2640,28 +2663,30 @@ def panelSide(iType):
 			if iType == "3" or iType == "4":
 				[ x, y, z ] = getVertex(gFace, 1, 0)
 
-		if iType == "1":
-			x = x - Length
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelSideLeft")
+		[ name, mx, mz ] = gSidePanels[iType]
+		x = x + mx * Length
+		z = z + mz * Length
+
+		doc = FreeCAD.activeDocument()
 		
-		if iType == "2":
-			z = z + Length
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelSideLeftUP")
+		# new panel with sizes and position as single undo step, if there is no open transaction already
+		owner = not doc.HasPendingTransaction
+		if owner:
+			doc.openTransaction("panelSide")
 		
-		if iType == "3":
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelSideRight")
+		try:
+			panel = doc.addObject("Part::Box", name)
+			panel.Length, panel.Width, panel.Height = Length, Width, Height
+			panel.Placement.Base = FreeCAD.Vector(x, y, z)
+		except:
+			if owner:
+				doc.abortTransaction()
+			raise
 		
-		if iType == "4":
-			x = x - Length
-			z = z + Length
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelSideRightUP")
-
-		panel.Length = Length
-		panel.Width = Width
-		panel.Height = Height
+		if owner:
+			doc.commitTransaction()
 		
-		panel.Placement = FreeCAD.Placement(FreeCAD.Vector(x, y, z), FreeCAD.Rotation(0, 0, 0))
-		FreeCAD.activeDocument().recompute()
+		doc.recompute()
 
 	except:
 		
@@ -2669,14 +2694,7 @@ def panelSide(iType):
 		
 		info += translate('panelSideInfo', 'This tool creates new panel at selected face. The blue panel represents the selected object and the red one represents the new created object. The arrow describe if the panel will be created up or down. The icon refers to base XY model view (0 key position). Click fitModel to set model into referred view. If you have problem with unpredicted result, use magicManager tool to preview panel before creation.')
 
-		if iType == "1":
-			showInfo("panelSideLeft", info)
-		if iType == "2":
-			showInfo("panelSideLeftUP", info)
-		if iType == "3":
-			showInfo("panelSideRight", info)
-		if iType == "4":
-			showInfo("panelSideRightUP", info)
+		showInfo(gSidePanels[iType][0], info)
 
 
 # ###################################################################################################################
@@ -2703,11 +2721,14 @@ def panelBackOut():
 
 	try:
 
-		gObj = getReference()
+		doc = FreeCAD.activeDocument()
 
-		gFace1 = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		gFace2 = FreeCADGui.Selection.getSelectionEx()[1].SubObjects[0]
-		gFace3 = FreeCADGui.Selection.getSelectionEx()[2].SubObjects[0]
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		gObj = getReference(selEx[0].Object)
+
+		gFace1 = getSelectedSubObject(selEx[0])
+		gFace2 = getSelectedSubObject(selEx[1])
+		gFace3 = getSelectedSubObject(selEx[2])
 
 		[ x, y, z ] = sizesToCubePanel(gObj, "ZX")
 
@@ -2720,13 +2741,13 @@ def panelBackOut():
 
 		if x > 0 and y > 0 and z > 0:
 
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelBackOut")
+			panel = doc.addObject("Part::Box", "panelBackOut")
 			panel.Length = x
 			panel.Width = y
 			panel.Height = z
 
-			panel.Placement = FreeCAD.Placement(FreeCAD.Vector(x1, y1, z3), FreeCAD.Rotation(0, 0, 0))
-			FreeCAD.activeDocument().recompute()
+			panel.Placement.Base = FreeCAD.Vector(x1, y1, z3)
+			doc.recompute()
 			
 		else:
 		
@@ -2765,11 +2786,14 @@ def panelCover(iType):
 
 	try:
 
-		gObj = getReference()
+		doc = FreeCAD.activeDocument()
+
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		gObj = getReference(selEx[0].Object)
 		
-		gFace1 = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		gFace2 = FreeCADGui.Selection.getSelectionEx()[1].SubObjects[0]
-		gFace3 = FreeCADGui.Selection.getSelectionEx()[2].SubObjects[0]
+		gFace1 = getSelectedSubObject(selEx[0])
+		gFace2 = getSelectedSubObject(selEx[1])
+		gFace3 = getSelectedSubObject(selEx[2])
 
 		[ x, y, z ] = sizesToCubePanel(gObj, iType)
 
@@ -2782,13 +2806,13 @@ def panelCover(iType):
 
 		if x > 0 and y > 0 and z > 0:
 		
-			panel = FreeCAD.activeDocument().addObject("Part::Box", "panelCover"+iType)
+			panel = doc.addObject("Part::Box", "panelCover"+iType)
 			panel.Length = x
 			panel.Width = y
 			panel.Height = z
 
-			panel.Placement = FreeCAD.Placement(FreeCAD.Vector(x1, y1, z3), FreeCAD.Rotation(0, 0, 0))
-			FreeCAD.activeDocument().recompute()
+			panel.Placement.Base = FreeCAD.Vector(x1, y1, z3)
+			doc.recompute()
 
 	except:
 		
@@ -2824,12 +2848,14 @@ def panel2pad(iLabel="panel2pad"):
 
 	try:
 
+		doc = FreeCAD.activeDocument()
+
 		gObj = FreeCADGui.Selection.getSelection()[0]
 
-		[ part, body, sketch, pad ] = makePad(gObj, iLabel)
+		[ part, body, sketch, pad ] = makePad(gObj, iLabel, False)
 		
-		FreeCAD.ActiveDocument.removeObject(gObj.Name)
-		FreeCAD.activeDocument().recompute()
+		doc.removeObject(gObj.Name)
+		doc.recompute()
 		
 		return [ part, body, sketch, pad ]
 
@@ -2866,8 +2892,11 @@ def panel2profile():
 		transfomrations.
 	'''
 
+	toRemove = []
+
 	try:
 
+		doc = FreeCAD.activeDocument()
 		profiles = []
 		objects = FreeCADGui.Selection.getSelection()
 		if len(objects) == 0:
@@ -2875,24 +2904,25 @@ def panel2profile():
 			
 		for gObj in objects:
 		
-			sizes = getSizes(gObj)
-			sizes.sort()
+			sizes = getSortedSizes(gObj)
 			if sizes[0] != sizes[1]:
 				raise
 			
-			[ part, body, sketch, pad ] = makePad(gObj, "Construction")
-			FreeCAD.ActiveDocument.removeObject(gObj.Name)
-			FreeCAD.activeDocument().recompute()
+			[ part, body, sketch, pad ] = makePad(gObj, "Construction", False)
+			toRemove.append(gObj.Name)
+			doc.recompute()
 			
 			profile = body.newObject('PartDesign::Thickness','Profile')
 			
+			# profile faces are squares with thickness side
+			target = int(round(4 * sizes[0]))
+			
 			faces = []
 			i = 0
 			for f in pad.Shape.Faces:
-				if int(round(pad.Shape.Faces[i].Length)) == int(round(4 * sizes[0])):
-					faces.append("Face"+str(i+1))
-
 				i = i + 1
+				if int(round(f.Length)) == target:
+					faces.append("Face"+str(i))
 				
 			profile.Base = (pad, faces)
 			profile.Value = 1
@@ -2902,29 +2932,27 @@ def panel2profile():
 			profile.Join = 0
 
 			pad.Visibility = False
-
-			FreeCAD.activeDocument().recompute()
-			
-			colors = [ (0.0, 0.0, 0.0, 0.0),
-				(0.0, 0.0, 0.0, 0.0),
-				(0.0, 0.0, 0.0, 0.0),
-				(0.0, 0.0, 0.0, 0.0),
-				(0.0, 0.0, 0.0, 0.0),
-				(0.0, 1.0, 0.0, 0.0),
-				(0.0, 0.0, 0.0, 0.0),
-				(0.0, 1.0, 0.0, 0.0),
-				(0.0, 1.0, 0.0, 0.0),
-				(0.0, 1.0, 0.0, 0.0) ]
-
-			profile.ViewObject.DiffuseColor = colors
-
-			FreeCAD.activeDocument().recompute()
 			profiles.append(profile)
+
+		# remove replaced panels at once, the Pads do not depend on them
+		for name in toRemove:
+			doc.removeObject(name)
+		
+		# single recompute for all profiles, the colors need profile faces
+		doc.recompute()
+		
+		for profile in profiles:
+			profile.ViewObject.DiffuseColor = gProfileColors
 		
 		return profiles
 	
 	except:
 		
+		# remove panels already replaced, to not leave them next to the new Pads
+		for name in toRemove:
+			if doc.getObject(name):
+				doc.removeObject(name)
+		
 		info = ""
 		
 		info += translate('panel2profileInfo', 'This tool allows to replace Cube panel with construction profile. You can replace more than one Cube panel at once. To select more objects hold left CTRL key during selection. The selected Cube objects need to have two equal sizes e.g. 20 mm x 20 mm x 300 mm to replace it with construction profile. The new created construction profile will get the same dimensions, placement and rotation as the selected Cube panel. If you have all construction created with simple Cube objects that imitating profiles, you can replace all of them with realistic looking construction profiles with single click.')
@@ -2957,28 +2985,24 @@ def panel2frame():
 		transfomrations.
 	'''
 
+	toRemove = []
+
 	try:
 
+		doc = FreeCAD.activeDocument()
 		frames = []
 		frame = ""
-		objects = FreeCADGui.Selection.getSelection()
+		selEx = FreeCADGui.Selection.getSelectionEx()
 		
-		if len(objects) == 0:
+		if len(selEx) == 0:
 			raise
 		
-		faces = dict()
-		
-		i = 0
-		for o in objects:
-			faces[o] = FreeCADGui.Selection.getSelectionEx()[i].SubObjects
-			i = i + 1
-
-		for o in objects:
+		for sx in selEx:
 			
-			face = faces[o][0]
+			o = sx.Object
+			face = getSelectedSubObject(sx)
 		
-			sizes = getSizes(o)
-			sizes.sort()
+			sizes = getSortedSizes(o)
 			
 			[ faceType, arrAll, arrThick, arrShort, arrLong ] = getFaceEdges(o, face)
 			
@@ -2992,36 +3016,45 @@ def panel2frame():
 				size = sizes[0]
 				
 			for e in arr:
-				keys.append(e.BoundBox)
+				keys.append(normalizeBoundBox(e.BoundBox))
 			
-			[ part, body, sketch, pad ] = makePad(o, "Frame")
-			FreeCAD.ActiveDocument.removeObject(o.Name)
-			FreeCAD.activeDocument().recompute()
+			[ part, body, sketch, pad ] = makePad(o, "Frame", False)
+			toRemove.append(o.Name)
+			doc.recompute()
 		
+			# get the edges index map once for all keys
+			edgeMap = getIndexMap(pad, "Edges")
+			
 			edges = []
 			for k in keys:
-				index = getEdgeIndexByKey(pad, k)
-				edges.append("Edge"+str(int(index)))
+				edges.append("Edge"+str(edgeMap.get(k, -1)))
 			
 			frame = body.newObject('PartDesign::Chamfer','Frame45Cut')
 			frame.Base = (pad, edges)
 			frame.Size = size - 0.01
 			pad.Visibility = False
-			
-			FreeCAD.activeDocument().recompute()
-			
-			color = (0.5098039507865906, 0.3137255012989044, 0.1568627506494522, 0.0)
-
-			frame.ViewObject.ShapeColor = color
-			frame.ViewObject.DiffuseColor = color
-			FreeCAD.activeDocument().recompute()
-			
 			frames.append(frame)
 		
+		# remove replaced panels at once, the Pads do not depend on them
+		for name in toRemove:
+			doc.removeObject(name)
+		
+		# single recompute for all frames
+		doc.recompute()
+		
+		for frame in frames:
+			frame.ViewObject.ShapeColor = gFrameColor
+			frame.ViewObject.DiffuseColor = gFrameColor
+		
 		return frames
 	
 	except:
 		
+		# remove panels already replaced, to not leave them next to the new Pads
+		for name in toRemove:
+			if doc.getObject(name):
+				doc.removeObject(name)
+		
 		info = ""
 		
 		info += translate('panel2frameInfo', 'This tool allows to replace Cube panel with frame 45 cut at both sides. You can replace more than one Cube panel at once. To replace Cube objects with frames you have to select exact face at each Cube object. To select more objects hold left CTRL key during selection. The new created frame will get the same dimensions, placement and rotation as the selected Cube panel but will be cut at the selected face. If you have all construction created with simple Cube objects that imitating picture frame or window, you can replace all of them with realistic looking frame with single click.')
@@ -3055,35 +3088,37 @@ def panel2link():
 
 	try:
 
+		doc = FreeCAD.activeDocument()
+
 		links = []
 		objects = FreeCADGui.Selection.getSelection()
 		
 		if len(objects) < 2:
 			raise
 		
-		i = 0
-		for o in objects:
-			
-			i = i + 1
-			
-			if i == 1:
-				base = o
-				continue
+		base = objects[0]
+		toRemove = []
+		
+		for o in objects[1:]:
 			
 			linkName = "Link_" + str(o.Name)
-			link = FreeCAD.activeDocument().addObject('App::Link', linkName)
+			link = doc.addObject('App::Link', linkName)
 			link.setLink(base)
 			link.Label = "Link, " + o.Label
 			
 			[ x, y, z, r ] = getPlacement(o)
 			setPlacement(link, x, y, z, r)
 			
-			FreeCAD.ActiveDocument.removeObject(str(o.Name))
-			FreeCAD.activeDocument().recompute()
-			
+			toRemove.append(str(o.Name))
 			links.append(link)
-			
-			
+		
+		# remove replaced objects at once, the links point only to the base object
+		for name in toRemove:
+			doc.removeObject(name)
+		
+		# single recompute for all links
+		doc.recompute()
+		
 		return links
 	
 	except:
@@ -3125,13 +3160,10 @@ def drillHoles():
 
 	try:
 
-		import Part, Sketcher
-
-		base = FreeCADGui.Selection.getSelection()[0]
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		objects = FreeCADGui.Selection.getSelection()
-		
-		del objects[0]
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		base = selEx[0].Object
+		face = getSelectedSubObject(selEx[0])
+		objects = [ sx.Object for sx in selEx[1:] ]
 			
 		# if face is selected create drill bit at face only
 		if len(objects) == 0:
@@ -3144,16 +3176,13 @@ def drillHoles():
 			d.Height = 25
 
 			# default drill bit position 0 - vertex
-			[ v1, v2, v3, v4 ] = getFaceVertices(face)
-			x, y, z = v1[0], v1[1], v1[2]
+			[ x, y, z ] = getVertices(face, 1)[0]
 			
 			r = getFaceObjectRotation(base, face)
 			
-			setPlacement(d, x, y, z, r)
+			setNewPlacement(d, x, y, z, r)
 			
-			# default drill bit colors (middle, bottom, top)
-			colors = [ (1.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-			d.ViewObject.DiffuseColor = colors
+			d.ViewObject.DiffuseColor = gDrillBitColors["Hole"]
 			
 			return
 
@@ -3194,15 +3223,12 @@ def drillCountersinks():
 
 	try:
 
-		import Part, Sketcher
-
 		holes = []
 
-		base = FreeCADGui.Selection.getSelection()[0]
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		objects = FreeCADGui.Selection.getSelection()
-		
-		del objects[0]
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		base = selEx[0].Object
+		face = getSelectedSubObject(selEx[0])
+		objects = [ sx.Object for sx in selEx[1:] ]
 
 		# if face is selected create drill bit at face only
 		if len(objects) == 0:
@@ -3216,16 +3242,13 @@ def drillCountersinks():
 			d.Height = 50
 
 			# default drill bit position 0 - vertex
-			[ v1, v2, v3, v4 ] = getFaceVertices(face)
-			x, y, z = v1[0], v1[1], v1[2]
+			[ x, y, z ] = getVertices(face, 1)[0]
 			
 			r = getFaceObjectRotation(base, face)
 			
-			setPlacement(d, x, y, z, r)
+			setNewPlacement(d, x, y, z, r)
 			
-			# default drill bit colors (middle, bottom, top)
-			colors = [ (0.0, 1.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0) ]
-			d.ViewObject.DiffuseColor = colors
+			d.ViewObject.DiffuseColor = gDrillBitColors["Countersink"]
 			
 			return
 		
@@ -3266,15 +3289,12 @@ def drillCounterbores():
 
 	try:
 
-		import Part, Sketcher
-
 		holes = []
 
-		base = FreeCADGui.Selection.getSelection()[0]
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		objects = FreeCADGui.Selection.getSelection()
-		
-		del objects[0]
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		base = selEx[0].Object
+		face = getSelectedSubObject(selEx[0])
+		objects = [ sx.Object for sx in selEx[1:] ]
 
 		# if face is selected create drill bit at face only
 		if len(objects) == 0:
@@ -3288,16 +3308,13 @@ def drillCounterbores():
 			d.Height = 50
 			
 			# default drill bit position 0 - vertex
-			[ v1, v2, v3, v4 ] = getFaceVertices(face)
-			x, y, z = v1[0], v1[1], v1[2]
+			[ x, y, z ] = getVertices(face, 1)[0]
 			
 			r = getFaceObjectRotation(base, face)
 			
-			setPlacement(d, x, y, z, r)
+			setNewPlacement(d, x, y, z, r)
 			
-			# default drill bit colors (middle, bottom, top)
-			colors = [ (0.0, 0.0, 1.0, 0.0), (0.0, 1.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0) ]
-			d.ViewObject.DiffuseColor = colors
+			d.ViewObject.DiffuseColor = gDrillBitColors["Counterbore"]
 
 			return
 		
@@ -3337,44 +3354,44 @@ def sketch2dowel():
 
 	try:
 	
-		objects = FreeCADGui.Selection.getSelection()
+		doc = FreeCAD.activeDocument()
+
+		selEx = FreeCADGui.Selection.getSelectionEx()
+		objects = [ sx.Object for sx in selEx ]
 
 		if len(objects) < 2:
 			raise
 
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-
-		i = 0
-		for o in objects:
-		
-			i = i + 1
-			
-			if i == 1:
-				base = o
-				continue
+		face = getSelectedSubObject(selEx[0])
 
-			sketch = o
+		# check whole selection first, so nothing is created for wrong selection
+		holes = []
+		for sketch in objects[1:]:
 
-			if not sketch.isDerivedFrom("Sketcher::SketchObject"):
+			if not isType(sketch, "Sketcher::SketchObject"):
 				raise
 				
+			# the Sketch can be used by Body and Hole, in any order
 			hole = ""
-				
-			if sketch.InList[0].isDerivedFrom("PartDesign::Hole"):
-				hole = sketch.InList[0]
-				
-			if sketch.InList[1].isDerivedFrom("PartDesign::Hole"):
-				hole = sketch.InList[1]
+			
+			for parent in sketch.InList:
+				if isType(parent, "PartDesign::Hole"):
+					hole = parent
+					break
 				
 			if hole == "":
 				raise
+			
+			holes.append([ sketch, hole ])
+
+		for [ sketch, hole ] in holes:
 					
 			x = sketch.Placement.Base.x
 			y = sketch.Placement.Base.y
 			z = sketch.Placement.Base.z
 			r = getFaceObjectRotation(hole, face)
 				
-			d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","DowelSketch")
+			d = doc.addObject("Part::Cylinder","DowelSketch")
 			d.Label = "Dowel - " + str(sketch.Label)
 
 			d.Radius = hole.Diameter / 2
@@ -3418,24 +3435,29 @@ def edge2dowel():
 
 	try:
 
+		doc = FreeCAD.activeDocument()
+
 		dowels = []
 		objects = FreeCADGui.Selection.getSelectionEx()[0].SubObjects
 
 		if len(objects) == 0:
 			raise
 		
-		for e in objects:
+		# each Curve access creates new geometry object, so get it once
+		curves = [ e.Curve for e in objects ]
 		
-			if not e.Curve.isDerivedFrom("Part::GeomCircle"):
+		# check whole selection first, so nothing is created for wrong selection
+		for curve in curves:
+			if not curve.isDerivedFrom("Part::GeomCircle"):
 				raise
+		
+		for curve in curves:
 			
-			edgeRadius = e.Curve.Radius
-			x = e.Curve.Center[0]
-			y = e.Curve.Center[1]
-			z = e.Curve.Center[2]
-			r = e.Curve.Rotation
+			edgeRadius = curve.Radius
+			[ x, y, z ] = curve.Center
+			r = curve.Rotation
 			
-			d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","DowelEdge")
+			d = doc.addObject("Part::Cylinder","DowelEdge")
 			d.Label = "Dowel - edge "
 
 			d.Radius = edgeRadius
@@ -3481,24 +3503,32 @@ def edge2drillbit():
 
 	try:
 
+		doc = FreeCAD.activeDocument()
+
 		drillbits = []
 		objects = FreeCADGui.Selection.getSelectionEx()[0].SubObjects
 
 		if len(objects) == 0:
 			raise
 		
-		for e in objects:
+		# each Curve access creates new geometry object, so get it once
+		curves = [ e.Curve for e in objects ]
 		
-			if not e.Curve.isDerivedFrom("Part::GeomCircle"):
+		# check whole selection first, so nothing is created for wrong selection
+		for curve in curves:
+			if not curve.isDerivedFrom("Part::GeomCircle"):
 				raise
+		
+		# all drill bits have the same colors, so get them once
+		colors = gDrillBitColors["Hole"]
+		
+		for curve in curves:
 			
-			edgeRadius = e.Curve.Radius - 1
-			x = e.Curve.Center[0]
-			y = e.Curve.Center[1]
-			z = e.Curve.Center[2]
-			r = e.Curve.Rotation
+			edgeRadius = curve.Radius - 1
+			[ x, y, z ] = curve.Center
+			r = curve.Rotation
 			
-			d = FreeCAD.ActiveDocument.addObject("Part::Cylinder","DrillBitHole")
+			d = doc.addObject("Part::Cylinder","DrillBitHole")
 			d.Label = "Drill Bit - simple hole "
 
 			d.Radius = edgeRadius
@@ -3506,12 +3536,12 @@ def edge2drillbit():
 
 			setPlacement(d, x, y, z, r)
 			
-			# default drill bit colors (middle, bottom, top)
-			colors = [ (1.0, 0.0, 0.0, 0.0), (1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0) ]
-			d.ViewObject.DiffuseColor = colors
-			
 			drillbits.append(d)
 
+		# set colors after all drill bits are created, the same way as at panel2profile
+		for d in drillbits:
+			d.ViewObject.DiffuseColor = colors
+
 		return drillbits
 			
 	except:
@@ -3543,7 +3573,7 @@ def magicCut():
 		
 	Result:
 
-		Array of cut objects will be returned.
+		Array with single cut object will be returned, see makeCuts.
 	'''
 
 	try:
@@ -3553,7 +3583,22 @@ def magicCut():
 		if len(objects) < 2:
 			raise
 
-		cuts = makeCuts(objects)
+		# all copies, fuse and cut as single undo step, if there is no open transaction already
+		doc = FreeCAD.activeDocument()
+		owner = not doc.HasPendingTransaction
+		if owner:
+			doc.openTransaction("magicCut")
+		
+		try:
+			cuts = makeCuts(objects)
+		except:
+			if owner:
+				doc.abortTransaction()
+			raise
+		
+		if owner:
+			doc.commitTransaction()
+		
 		FreeCADGui.Selection.clearSelection()
 		
 		return cuts
@@ -3590,21 +3635,17 @@ def jointTenon():
 
 	try:
 
-		base = getReference()
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		
-		joint = FreeCAD.ActiveDocument.addObject("Part::Box","jointtenon")
-		joint.Label = str(base.Label) + ", joint - Tenon "
+		doc = FreeCAD.activeDocument()
+
+		# get position before the joint is created, so wrong selection leaves nothing
+		[ base, x, y, z, r ] = getSelectedFacePosition()
 		
-		size = 6.35
-		joint.Width, joint.Height, joint.Length = 1 * size, 3 * size, 5 * size
+		joint = doc.addObject("Part::Box","jointtenon")
+		joint.Label = base.Label + ", joint - Tenon "
 		
-		[ v1, v2, v3, v4 ] = getFaceVertices(face)
-		x, y, z = v1[0], v1[1], v1[2]
+		joint.Length, joint.Width, joint.Height = gJointSizes["Tenon"]
 			
-		r = getFaceObjectRotation(base, face)
-			
-		setPlacement(joint, x, y, z, r)
+		setNewPlacement(joint, x, y, z, r)
 			
 		return
 
@@ -3639,25 +3680,14 @@ def jointCustom():
 
 	try:
 
-		base = getReference()
-		face = FreeCADGui.Selection.getSelectionEx()[0].SubObjects[0]
-		
-		joint = FreeCAD.ActiveDocument.addObject("Part::Box","jointcustom")
-		joint.Label = str(base.Label) + ", joint - Custom "
+		# get position before the joint is created, so wrong selection leaves nothing
+		[ base, x, y, z, r ] = getSelectedFacePosition()
 		
-		size = 6.35
-		joint.Length, joint.Width, joint.Height = 5 * size, 3 * size, 1 * size
+		label = base.Label + ", joint - Custom "
 		
-		[ v1, v2, v3, v4 ] = getFaceVertices(face)
-		x, y, z = v1[0], v1[1], v1[2]
-			
-		r = getFaceObjectRotation(base, face)
-			
-		setPlacement(joint, x, y, z, r)
-		[ part, body, sketch, pad ] = makePad(joint, joint.Label)
-		
-		FreeCAD.ActiveDocument.removeObject(joint.Name)
-		FreeCAD.activeDocument().recompute()
+		# create Pad directly, the same as Cube with these sizes changed with makePad
+		sizes = gJointSizes["Custom"]
+		[ part, body, sketch, pad ] = makePadFromSizes(sizes, x, y, z, r, "XY", label)
 		
 		return
 
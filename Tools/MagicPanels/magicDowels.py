@@ -787,8 +787,7 @@ def showQtGUI():
 				# set default
 				# ############################################################################
 
-				s = MagicPanels.getSizes(self.gObjBase)
-				s.sort()
+				s = MagicPanels.getSortedSizes(self.gObjBase)
 				self.gThick = s[0]
 				
 				self.gDOEdge = self.gThick / 2
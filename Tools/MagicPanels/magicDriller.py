@@ -795,8 +795,7 @@ def showQtGUI():
 				# set default
 				# ############################################################################
 
-				s = MagicPanels.getSizes(self.gObjBase)
-				s.sort()
+				s = MagicPanels.getSortedSizes(self.gObjBase)
 				self.gThick = s[0]
 				
 				self.gDBOEdge = self.gThick / 2
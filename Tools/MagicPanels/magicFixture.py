@@ -570,10 +570,9 @@ def showQtGUI():
 				# set possible edges
 				# ############################################################################
 				
-				self.gEdgeArr.append(self.gFaceRef.Edges[0])
-				self.gEdgeArr.append(self.gFaceRef.Edges[1])
-				self.gEdgeArr.append(self.gFaceRef.Edges[2])
-				self.gEdgeArr.append(self.gFaceRef.Edges[3])
+				# the face needs 4 edges, for other faces the IndexError resets the selection
+				edges = self.gFaceRef.Edges
+				self.gEdgeArr += [ edges[0], edges[1], edges[2], edges[3] ]
 					
 				# ############################################################################
 				# set possible rotation 
@@ -260,9 +260,7 @@ def showQtGUI():
 
 				self.gObj = MagicPanels.getReference()
 				
-				sizes = []
-				sizes = MagicPanels.getSizes(self.gObj)
-				sizes.sort()
+				sizes = MagicPanels.getSortedSizes(self.gObj)
 				self.gStep = sizes[0]
 				self.o4E.setText(str(self.gStep))
 				
@@ -1149,6 +1149,8 @@ def getEdgeBand(iObj, iW, iH, iL, iCaller="getEdgeBand"):
 		vFaceV = []
 
 		# search for edgeband
+		vFaces = iObj.Shape.Faces
+		
 		i = 0
 		for c in vFacesColors:
 
@@ -1161,7 +1163,7 @@ def getEdgeBand(iObj, iW, iH, iL, iCaller="getEdgeBand"):
 			# it means this edge is covered by user
 			if str(c) != str(sFColor):
 				
-				vFaceEdge = iObj.Shape.Faces[i].Length
+				vFaceEdge = vFaces[i].Length
 	
 				# get the thickness dimension
 				vT = getKey(iObj, iW, iH, iL, "thick", iCaller)